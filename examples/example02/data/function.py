@@ -1,4 +1,16 @@
-import random
+from numpy.random import default_rng
+
+# ---- random numbers -----------------
+
+# Random numbers of the drill breakage and the surface, drawn in blocks by numpy (set seed to reproduce a run)
+def random_pool(draw):
+    while True:
+        yield from draw(100_000).tolist()
+
+seed = None
+rng = default_rng(seed)
+uniform = random_pool(rng.random).__next__
+standard_normal = random_pool(rng.standard_normal).__next__
 
 # ---- sources ------------------------
 
@@ -12,20 +24,24 @@ def shaft_source(env, factory):
 
 def drilling(env, item, machine, factory):
 
-    if random.random() < machine.drill_breakage:
-        item.surface += random.normalvariate(2.5, 0.1)
+    if uniform() < machine.drill_breakage:
+        item.surface += 2.5 + 0.1 * standard_normal()
 
     yield env.timeout(2)
 
 def turning(env, item, machine, factory):
 
-    if machine.wear >= 1:
+    wear = machine.wear
+
+    # it's possible to use the machine 167 times, before it has to be maintained
+    if wear >= 1:
+        wear = 0
         machine.wear = 0
         yield env.timeout(10)
 
-    item.surface += machine.wear**2 * 1.5 - 2
-    # it's possible to use the machine 50 times, before it has to be maintained
-    machine.wear += 0.006
+    item.surface += wear * wear * 1.5 - 2
+
+    machine.wear = wear + 0.006
     yield env.timeout(1)
 
 def polishing(env, item, machine, factory):
@@ -37,7 +53,8 @@ def polishing(env, item, machine, factory):
 # ---- global functions ---------------
 
 
-temp_dict = {0: 19, 240: 18, 480: 20, 720: 23, 960: 22, 1200: 20}
+# Temperature for each 4-hour interval of the day
+temperatures = (19, 18, 20, 23, 22, 20)
 
 def temperature_func(env, factory):
 
@@ -45,7 +62,7 @@ def temperature_func(env, factory):
     day_time: int = env.now % 1440
 
     # Set the temperature in the factory based on the time of day
-    factory.temperature = temp_dict[day_time]
+    factory.temperature = temperatures[day_time // 240]
 
     yield env.timeout(240)
 
@@ -1,4 +1,18 @@
-from random import normalvariate, random
+from bisect import bisect_right
+
+from numpy.random import default_rng
+
+# ---- random numbers -----------------
+
+# Random numbers of the bolt demand, drawn in blocks by numpy (set seed to reproduce a run)
+def random_pool(draw):
+    while True:
+        yield from draw(100_000).tolist()
+
+seed = None
+rng = default_rng(seed)
+uniform = random_pool(rng.random).__next__
+standard_normal = random_pool(rng.standard_normal).__next__
 
 # ---- sources ------------------------
 
@@ -8,25 +22,30 @@ def infinite_source(env, factory):
 # ---- sinks ---------------------------
 
 
-# Defines the demand distribution over time
-time_dict = {1: [0, 4], 2: [4, 8], 3: [8, 12], 4: [12, 16], 5: [16, 20], 6: [20, 24]}
-demand_dict = {1: [7, 0.5], 2: [8, 0.7], 3: [20.5, 1], 4: [22, 1.7], 5: [20, 2.5], 6: [12, 1.2]}
+# Defines the demand distribution over time: (start [h], end [h], mean, standard deviation)
+demand_profile = ((0, 4, 7, 0.5), (4, 8, 8, 0.7), (8, 12, 20.5, 1), (12, 16, 22, 1.7), (16, 20, 20, 2.5),
+                  (20, 24, 12, 1.2))
+
+# Demand distribution for each minute of the day (None at the interval limits). This way the sink does not have to
+# search the time intervals in every time step
+demand_by_minute = [None] * 1440
+for start, end, mean, sigma in demand_profile:
+    for minute in range(start * 60 + 1, end * 60):
+        demand_by_minute[minute] = (mean, sigma)
+demand_by_minute = tuple(demand_by_minute)
 
 def bolt_sink(env, factory):
 
     demand = 0
-    day_time = env.now % 1440
 
     # Determine the standard demand
-    for index, time_interval in time_dict.items():
-        if time_interval[0] < day_time/60 < time_interval[1]:
-            dis = demand_dict[index]
-            demand += int(normalvariate(dis[0], dis[1]))
-            break
+    dis = demand_by_minute[int(env.now) % 1440]
+    if dis is not None:
+        demand += int(dis[0] + dis[1] * standard_normal())
 
     # Determining the additional demand
-    if random() < 0.004:
-        demand += int(abs(normalvariate(250, 20)))
+    if uniform() < 0.004:
+        demand += int(abs(250 + 20 * standard_normal()))
 
     yield env.timeout(1)
 
@@ -40,12 +59,26 @@ def bolt_sink(env, factory):
 
 # ---- process functions --------------
 
+def release_waiting_forges(factory):
+    # Wake up as many waiting forging processes as further machines may be activated. The list of waiting processes is
+    # kept on the factory (one per simulation run), the leading underscore keeps it out of the tracked attributes
+    waiting_forges = getattr(factory, '_waiting_forges', None)
+    if waiting_forges:
+        free_machines = max(int(factory.max_active_machines - factory.active_machines), 0)
+        for event in waiting_forges[:free_machines]:
+            event.succeed()
+        del waiting_forges[:free_machines]
+
 def forging(env, item, machine, factory):
 
-    while True:
-        if factory.active_machines < factory.max_active_machines:
-            break
-        yield env.timeout(1)
+    # Instead of checking the capacity every minute, the process waits until a machine is deactivated or the maximum
+    # number of active machines is increased
+    while factory.active_machines >= factory.max_active_machines:
+        if not hasattr(factory, '_waiting_forges'):
+            factory._waiting_forges = []
+        event = env.event()
+        factory._waiting_forges.append(event)
+        yield event
 
     factory.active_machines += 1
 
@@ -54,20 +87,26 @@ def forging(env, item, machine, factory):
     factory.number_bolts += 6
 
     factory.active_machines -= 1
+    release_waiting_forges(factory)
 
 # ---- global functions ---------------
 
 
-control_logic = {1000: 5, 2000: 4, 3000: 3, 4000: 2, 5000: 1}
+# Upper limits of the number of bolts and the corresponding maximum number of active machines. The last entry applies,
+# if the number of bolts is greater than or equal to all limits
+control_limits = (1000, 2000, 3000, 4000, 5000)
+control_machines = (5, 4, 3, 2, 1, 0)
 
 def global_control(env, factory):
 
-    # Set max_active_machines_based on number_bolts
-    for quantity in control_logic.keys():
-        if factory.number_bolts < quantity:
-            factory.max_active_machines = control_logic[quantity]
-            break
-        factory.max_active_machines = 0
+    # Set max_active_machines_based on number_bolts (binary search over the limits)
+    max_active_machines = control_machines[bisect_right(control_limits, factory.number_bolts)]
+
+    # If the limit is increased, waiting forging processes may start
+    increased = max_active_machines > factory.max_active_machines
+    factory.max_active_machines = max_active_machines
+    if increased:
+        release_waiting_forges(factory)
 
     # Update every time step (minute)
     yield env.timeout(1)
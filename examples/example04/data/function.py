@@ -1,4 +1,15 @@
-from random import normalvariate
+from numpy.random import default_rng
+
+# ---- random numbers -----------------
+
+# Random numbers of the molded hole diameters, drawn in blocks by numpy (set seed to reproduce a run)
+def random_pool(draw):
+    while True:
+        yield from draw(100_000).tolist()
+
+seed = None
+rng = default_rng(seed)
+standard_normal = random_pool(rng.standard_normal).__next__
 
 # ---- sources ------------------------
 
@@ -14,68 +25,92 @@ def source_2(env, factory):
 
 # ---- process functions --------------
 
+def get_t(d1, d2):
+    # Tension between two joints with the diameters d1 and d2
+    return (d2 - d1 - 2)**3 + 20
+
 def assemble_figure(env, item, machine, factory):
 
+    # Get the assembled items, so that each of them is looked up only once
+    body = item.body
+    upper_limb_1, upper_limb_2 = item.upper_limb
+    leg_1, leg_2 = item.leg
+
     # Get the diameters of the assembled items
-    d3_1 = item.upper_limb[0].arm.d3
-    d3_2 = item.upper_limb[1].arm.d3
-    d9_1 = item.leg[0].d9
-    d9_2 = item.leg[1].d9
+    d3_1 = upper_limb_1.arm.d3
+    d3_2 = upper_limb_2.arm.d3
+    d9_1 = leg_1.d9
+    d9_2 = leg_2.d9
     d10 = item.head.d10
 
-    def get_t(d1, d2):
-        return (d2 - d1 - 2)**3 + 20
-
     # Calculate the tension
-    item.t4 = get_t(item.body.d4, d3_1)
-    item.t5 = get_t(item.body.d5, d9_1)
-    item.t6 = get_t(item.body.d6, d9_2)
-    item.t7 = get_t(item.body.d7, d3_2)
-    item.t8 = get_t(item.body.d8, d10)
+    item.t4 = get_t(body.d4, d3_1)
+    item.t5 = get_t(body.d5, d9_1)
+    item.t6 = get_t(body.d6, d9_2)
+    item.t7 = get_t(body.d7, d3_2)
+    item.t8 = get_t(body.d8, d10)
 
     # Block the machine for the assembly time
     yield env.timeout(1)
 
-def quality_check(env, item, machine, factory):
+# Limits for the tension
+t_min = 17.0
+t_max = 23.0
+
+def is_reject(t):
+    # A figure is rejected, if one of its tensions is not within the limits
+    return t <= t_min or t >= t_max
 
-    # Limits for the tension
-    t_min = 17.0
-    t_max = 23.0
+def quality_check(env, item, machine, factory):
 
-    def is_reject(t):
-        if t <= t_min or t >= t_max:
-            item.reject = True
-            factory.rejected_id = item.item_id
-            return True
-        return False
+    # Get the tensions once
+    upper_limb_1, upper_limb_2 = item.upper_limb
+    t4, t5, t6, t7, t8 = item.t4, item.t5, item.t6, item.t7, item.t8
+    t2_1, t2_2 = upper_limb_1.t2, upper_limb_2.t2
 
-    # Reject items and update profiling attributes
-    if is_reject(item.t4):
+    # Update profiling attributes
+    rejected = False
+    if is_reject(t4):
         machine.r4 += 1
-    if is_reject(item.t5):
+        rejected = True
+    if is_reject(t5):
         machine.r5 += 1
-    if is_reject(item.t6):
+        rejected = True
+    if is_reject(t6):
         machine.r6 += 1
-    if is_reject(item.t7):
+        rejected = True
+    if is_reject(t7):
         machine.r7 += 1
-    if is_reject(item.t8):
+        rejected = True
+    if is_reject(t8):
         machine.r8 += 1
-    if is_reject(item.upper_limb[0].t2):
+        rejected = True
+    if is_reject(t2_1):
         machine.r2_1 += 1
-    if is_reject(item.upper_limb[1].t2):
+        rejected = True
+    if is_reject(t2_2):
         machine.r2_2 += 1
+        rejected = True
+
+    # Reject items
+    if rejected:
+        item.reject = True
+        factory.rejected_id = item.item_id
 
     # Block quality machine
     yield env.timeout(1)
 
 def molding(env, item, machine, factory):
 
-    if machine.hole_diameter >= 40.6:
-        machine.hole_diameter = 40
+    # Read the hole diameter once, so that the arithmetic below works on a local variable
+    hole_diameter = machine.hole_diameter
+
+    if hole_diameter >= 40.6:
+        hole_diameter = 40
 
-    item.d8 = normalvariate(machine.hole_diameter, 0.4)
+    item.d8 = hole_diameter + 0.4 * standard_normal()
 
-    machine.hole_diameter += 0.0004
+    machine.hole_diameter = hole_diameter + 0.0004
 
     yield env.timeout(1)
 
@@ -84,7 +119,7 @@ def assemble_limb(env, item, machine, factory):
     d1 = item.hand.d1
     d2 = item.arm.d2
 
-    item.t2 = (d1 - d2 - 2)**3 + 20
+    item.t2 = get_t(d2, d1)
 
     yield env.timeout(1)
 
@@ -1,4 +1,16 @@
-from random import random
+from numpy.random import default_rng
+
+# ---- random numbers -----------------
+
+# Random numbers of the bulb production, drawn in blocks by numpy (set seed to reproduce a run)
+def random_pool(draw):
+    while True:
+        yield from draw(100_000).tolist()
+
+seed = None
+rng = default_rng(seed)
+uniform = random_pool(rng.random).__next__
+standard_normal = random_pool(rng.standard_normal).__next__
 
 # ---- sources ------------------------
 
@@ -6,7 +18,7 @@ def source_1(env, factory):
     yield env.timeout(1)
     amount = 1
     if 480 <= env.now % 1440 <= 960:
-        amount += int(normalvariate(3, 0.8))
+        amount += int(3 + 0.8 * standard_normal())
     yield amount
 
 
@@ -18,7 +30,6 @@ def source_2(env, factory):
 
 # ---- process functions --------------
 
-from random import normalvariate
 def bridge_func(env, item, machine, factory):
 
     if item.attr_b_2:
@@ -28,7 +39,7 @@ def bridge_func(env, item, machine, factory):
         yield env.timeout(2)
         machine.wear = 0
 
-    machine.wear += normalvariate(0.05,0.01)
+    machine.wear += 0.05 + 0.01 * standard_normal()
     yield env.timeout(1)
 
     yield env.timeout(1)
@@ -37,7 +48,7 @@ def bridge_func(env, item, machine, factory):
 def mount_func(env, item, machine, factory):
 
     # To demonstrate how get_rejected works
-    if random() < 0.01:
+    if uniform() < 0.01:
         item.reject = True
 
     yield env.timeout(1)
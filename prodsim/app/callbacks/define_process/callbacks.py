@@ -24,7 +24,7 @@ The utilities used, can be found in prodsim.app.callbacks.define_process.support
 # Edit factory          #0017
 # Info edit factory     #0018
 
-from json import dump
+from json import dumps
 import os
 
 from dash.dependencies import Output, Input, State
@@ -33,13 +33,6 @@ from dash import callback_context, no_update
 
 from prodsim.app.callbacks.define_process.support import *
 
-# Counter variables that track how many times a window has been opened
-count_add_order: int = 0
-count_create_files: int = 0
-count_combine_stations: int = 0
-count_change_order: int = 0
-count_change_station: int = 0
-
 # Variables for caching user input during a dialog interaction
 cache_order: dict = {}
 cache_attr: dict = {}
@@ -54,9 +47,79 @@ process_data: dict = {
     }
 }
 
+# Lazy return
+nu = no_update
+
 # Current dialog (for attribute adding)
 curr_dia: Tuple[str, str] = ('', '')
 
+# Outputs of 'select node', if the station or order dialog is only closed or opened again
+station_dialog_closed: tuple = (False,) + (no_update,) * 12
+order_dialog_closed: tuple = (no_update, False) + (no_update,) * 11
+station_dialog_opened: tuple = (True,) + (no_update,) * 12
+order_dialog_opened: tuple = (no_update, True) + (no_update,) * 11
+dialogs_unchanged: tuple = (no_update,) * 13
+
+# Version of process_data, which is increased on every change, and the last graph created from it
+process_version: int = 0
+graph_cache: tuple = (-1, [], {})
+
+# Index of the stations and orders by name (valid for the process_version stored in the first element)
+index_cache: Tuple[int, Dict[str, int], Dict[str, int]] = (-1, {}, {})
+
+
+def get_name_index() -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Returns the indices of all stations and all orders in process_data by their name.
+
+    The indices are only recreated, if process_data has changed since the last call.
+    """
+
+    global index_cache
+
+    if index_cache[0] != process_version:
+        index_cache = (process_version, name_index(process_data['station']), name_index(process_data['order']))
+
+    return index_cache[1], index_cache[2]
+
+
+def triggered_id() -> str:
+    """Returns the id of the component, whose property triggered the current callback ('' if none did).
+
+    """
+
+    triggered: list = callback_context.triggered
+
+    return triggered[0]['prop_id'].partition('.')[0] if triggered else ''
+
+
+# Results of support functions (valid for the process_version stored in the first element)
+result_cache: Tuple[int, dict] = (-1, {})
+
+
+def cached_result(key: tuple, func, *args):
+    """Returns func(*args). The result is stored under the given key and only recalculated, if process_data has
+    changed since it was stored.
+    """
+
+    global result_cache
+
+    if result_cache[0] != process_version:
+        result_cache = (process_version, {})
+
+    if key not in result_cache[1]:
+        result_cache[1][key] = func(*args)
+
+    return result_cache[1][key]
+
+
+def get_order_station(station_name: str) -> List[tuple]:
+    """Returns the (order index, station index) tuples of all orders, in which the given station occurs.
+
+    The occurrences of all stations are only recreated, if process_data has changed since the last call.
+    """
+
+    return cached_result(('occurrences',), station_occurrences, process_data['order']).get(station_name, [])
+
 
 def dp_callbacks(app):
 
@@ -71,10 +134,14 @@ def dp_callbacks(app):
         Input: Click on the 'refresh graph' button
         Output: Elements displayed in the cyto-graph
 
-        First all nodes and edges are deleted and based on the currently defined process all nodes and edges are
-        redefined. This is because each object must have a unique id, which is ensured by deleting old objects.
+        Based on the currently defined process all nodes and edges are redefined. Each element gets an id, that only
+        depends on the process (node: name, edge: source->target). Cytoscape compares the new elements with the
+        displayed ones by their id, so that only the elements that were actually changed are removed or added.
+        If process_data has not changed since the last refresh, the cached elements are returned.
         """
 
+        global graph_cache
+
         layout = {
                      'name': 'breadthfirst',
                      'roots': []
@@ -84,81 +151,76 @@ def dp_callbacks(app):
         if not n_clicks:
             return [], layout
 
+        # Nothing has changed since the last refresh
+        if graph_cache[0] == process_version:
+            return graph_cache[1], graph_cache[2]
+
         # Lists in which the elements are created locally
         nodes = []
-        edges = []
+        edges: Dict[str, dict] = {}
+
+        # Stations that already have a node (combined stations are used by several orders)
+        station_nodes: set = set()
 
         # Create new edges and nodes
         for order in process_data['order']:
 
+            stations: List[str] = order['station']
+
             # Create a node for each station of the order and one for the final store for each order.
-            nodes += [{'data': {'id': station_name, 'label': station_name},
-                      'classes': 'black'} for station_name in order['station']] + \
-                    [{'data': {'id': order['name'], 'label': order['name']},
-                      'classes': 'black triangle'}]
+            for station_name in stations:
+                if station_name not in station_nodes:
+                    station_nodes.add(station_name)
+                    nodes.append({'data': {'id': station_name, 'label': station_name},
+                                  'classes': 'black'})
+            nodes.append({'data': {'id': order['name'], 'label': order['name']},
+                          'classes': 'black triangle'})
 
             # Create edges between each station of a job and between the last station of a job and the final memory.
-            for i in range(len(order['station'])):
-
-                if i < len(order['station']) - 1:
-                    target = order['station'][i + 1]
-                else:
-                    target = order['name']
+            for station_name, target, comp in zip(stations, stations[1:] + [order['name']], order['component']):
 
-                edges.append({'data': {'source': order['station'][i],
-                                       'target': target},
-                              'classes': 'arrow black'})
+                edges[station_name + '->' + target] = {'data': {'id': station_name + '->' + target,
+                                                                'source': station_name,
+                                                                'target': target},
+                                                       'classes': 'arrow black'}
 
                 # Create an edge for each assembly relationship.
                 # From the end store to the station where the assembly is executed
-                if comp := order['component'][i]:
+                for ass_order in comp:
 
-                    for(ass_order) in comp:
-
-                        edges.append({'data': {'source': ass_order,
-                                               'target': order['station'][i]},
-                                      'classes': 'arrow black'})
+                    edges[ass_order + '->' + station_name] = {'data': {'id': ass_order + '->' + station_name,
+                                                                       'source': ass_order,
+                                                                       'target': station_name},
+                                                              'classes': 'arrow black'}
 
         layout['roots'] = root_nodes(process_data['order'])
 
-        return edges + nodes, layout
+        graph_cache = (process_version, list(edges.values()) + nodes, layout)
+
+        return graph_cache[1], layout
 
     # Open add order #0002
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(n_clicks, is_open) {
+            return n_clicks ? !is_open : is_open;
+        }
+        """,
         Output('modal', 'is_open'),
         Input('add-order', 'n_clicks'),
         State('modal', 'is_open')
     )
-    def open_add_order_dialog(n_clicks, is_open) -> bool:
-        """
-        Input: Click on the 'add order' button and information, if the modal is open
-        Output: boolean, if the modal is open
-
-        Opens the modal 'add order'
-        """
-
-        if n_clicks:
-            return not is_open
-
-        return is_open
 
     # Info add order #0003
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(n_clicks) {
+            return Boolean(n_clicks);
+        }
+        """,
         Output(component_id='add_order_info', component_property='displayed'),
         Input(component_id='info_add_order', component_property='n_clicks')
     )
-    def info_add_order(n_clicks) -> bool:
-        """
-        Input: Click on the 'info' button
-        Output: boolean, if the modal is open
-
-        Opens the 'add order info' window
-        """
-
-        if n_clicks:
-            return True
-
-        return False
 
     # Add order #0004
     @app.callback(
@@ -170,13 +232,13 @@ def dp_callbacks(app):
          Output(component_id='priority_input', component_property='value'),
          Output(component_id='add_order_alert', component_property='displayed'),
          Output(component_id='add_order_alert', component_property='message')],
-        [Input(component_id='submit_add_order', component_property='n_clicks'),
-         Input(component_id='order_name_input', component_property='value'),
-         Input(component_id='source_name_input', component_property='value'),
-         Input(component_id='sink_name_input', component_property='value'),
-         Input(component_id='number_stations_input', component_property='value'),
-         Input(component_id='storage_input', component_property='value'),
-         Input(component_id='priority_input', component_property='value')]
+        Input(component_id='submit_add_order', component_property='n_clicks'),
+        [State(component_id='order_name_input', component_property='value'),
+         State(component_id='source_name_input', component_property='value'),
+         State(component_id='sink_name_input', component_property='value'),
+         State(component_id='number_stations_input', component_property='value'),
+         State(component_id='storage_input', component_property='value'),
+         State(component_id='priority_input', component_property='value')]
     )
     def update_add_order(n_clicks, name_order, name_source, name_sink, num_stations, storage, priority) -> tuple:
         """
@@ -186,15 +248,12 @@ def dp_callbacks(app):
         First, the user input is processed and checked for correctness. If the input is correct, the corresponding
         entries are made in the process file.
         """
-        global count_add_order
+        global process_version
 
         # Starting the ap
-        if not count_add_order < n_clicks:
+        if not n_clicks:
             raise PreventUpdate
 
-        # Update page counter
-        count_add_order += 1
-
         # Format user input
         user_input: Dict[str, str] = {
             'order name': name_order,
@@ -208,7 +267,7 @@ def dp_callbacks(app):
         # Open error-dialog, if the input is not valid
         if errors := check(process_data, user_input):
 
-            error_msg = "ERROR: \n" + ''.join(str(i + 1) + ". " + error + "\n" for i, error in enumerate(errors))
+            error_msg = format_errors(errors)
 
             return name_order, name_source, name_sink, num_stations, storage, priority, True, error_msg
 
@@ -218,6 +277,9 @@ def dp_callbacks(app):
         storage = int(storage) if storage else None
         priority = int(priority) if priority else 10
 
+        # Names of the stations of the new order
+        stations: List[str] = [name_order + str(i + 1) for i in range(num_stations)]
+
         # Add an order-dict to the process_data
         process_data['order'].append(
             {
@@ -226,63 +288,49 @@ def dp_callbacks(app):
                 'storage': storage,
                 'source': name_source,
                 'sink': name_sink,
-                'station': [name_order + str(i + 1) for i in range(int(num_stations))],
-                'function': [name_order + str(i + 1) + "_func" for i in range(int(num_stations))],
-                'demand': [1 for _ in range(int(num_stations))],
-                'component': [[] for _ in range(int(num_stations))]
+                'station': stations,
+                'function': [station + "_func" for station in stations],
+                'demand': [1] * num_stations,
+                'component': [[] for _ in range(num_stations)]
             }
         )
 
         # Add a station-dict to the process_data
-        for i in range(int(num_stations)):
-            process_data['station'].append(
-                {
-                    'name': name_order + str(i + 1),
-                    'capacity': 1,
-                    'storage': None,
-                    'measurement': False,
-                }
-            )
+        process_data['station'].extend(
+            {
+                'name': station,
+                'capacity': 1,
+                'storage': None,
+                'measurement': False,
+            } for station in stations
+        )
+        process_version += 1
 
         # Clear all text fields, so the user can add further orders
         return '', '', '', '', '', '', False, ''
 
     # Open save files #0005
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(n_clicks, is_open) {
+            return n_clicks ? !is_open : is_open;
+        }
+        """,
         Output(component_id='modal_creat_files', component_property='is_open'),
         Input(component_id='create-files', component_property='n_clicks'),
         State('modal_creat_files', 'is_open')
     )
-    def open_create_files(n_clicks, is_open) -> bool:
-        """
-        Input: Click on the 'refresh graph' button and information, if the modal ist open
-        Output: boolean, if the modal is open
-
-        Opens the modal 'create files'
-        """
-
-        if n_clicks:
-            return not is_open
-
-        return is_open
 
     # Info save files #0006
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(n_clicks) {
+            return Boolean(n_clicks);
+        }
+        """,
         Output(component_id='create_files_info', component_property="displayed"),
-        Input(component_id='info_create_files', component_property="n_clicks"),
+        Input(component_id='info_create_files', component_property="n_clicks")
     )
-    def create_files_info(n_clicks) -> bool:
-        """
-        Input: Click on the 'info' button
-        Output: boolean, if the modal is open
-
-        Opens the window 'create file info'
-        """
-
-        if n_clicks:
-            return True
-
-        return False
 
     # Save files #0007
     @app.callback(
@@ -292,9 +340,9 @@ def dp_callbacks(app):
          Output(component_id='name_input', component_property='value'),
          Output(component_id='create_files_alert', component_property='displayed'),
          Output(component_id='create_files_alert', component_property='message')],
-        [Input(component_id='submit_create_files', component_property='n_clicks'),
-         Input(component_id='path_input', component_property='value'),
-         Input(component_id='name_input', component_property='value')]
+        Input(component_id='submit_create_files', component_property='n_clicks'),
+        [State(component_id='path_input', component_property='value'),
+         State(component_id='name_input', component_property='value')]
     )
     def create_files(n_clicks, path, project_name) -> tuple:
         """
@@ -303,14 +351,10 @@ def dp_callbacks(app):
 
         Create the .py and .json file based on the global variable process_data
         """
-        global count_create_files
 
-        if not count_create_files < n_clicks:
+        if not n_clicks:
             raise PreventUpdate
 
-        # Update click count
-        count_create_files += 1
-
         # Format user input
         user_input: Dict[str, str] = {
             'path': path,
@@ -319,37 +363,33 @@ def dp_callbacks(app):
 
         # Open error-dialog, if the input is not valid
         if errors := check(process_data, user_input):
-            error_msg = "ERROR: \n" + ''.join(str(i + 1) + ". " + error + "\n" for i, error in enumerate(errors))
+            error_msg = format_errors(errors)
 
             return False, False, path, project_name, True, error_msg
 
         # Check if path is valid
-        if path[-1] not in ['/', '\\']:
-            path += '/'
         if not os.path.isdir(path):
             return True, False, path, project_name, False, ''
 
         # Create json file
-        with open(path + project_name + '_process.json', 'w') as f:
+        with open(os.path.join(path, project_name + '_process.json'), 'w') as f:
 
             _process_data = clear_process_data(process_data)
 
-            dump(_process_data, f, indent=4)
+            f.write(dumps(_process_data, indent=4))
 
         # Get all process functions, sources and sinks
         process_func: List[str] = []
         source_sink: List[str] = []
-        global_func: List[str] = []
         for order in process_data['order']:
-            process_func += order['function']
-            source_sink += [order['source']]
+            process_func.extend(order['function'])
+            source_sink.append(order['source'])
             if sink := order['sink']:
-                source_sink += [sink]
-        if g_func := process_data['factory']['function']:
-            global_func += g_func
+                source_sink.append(sink)
+        global_func: List[str] = process_data['factory']['function']
 
         # Create the python file
-        with open(path + project_name + '_function.py', 'w') as f:
+        with open(os.path.join(path, project_name + '_function.py'), 'w') as f:
 
             f.write(
                 "# ---- process models ---- \n" +
@@ -363,41 +403,27 @@ def dp_callbacks(app):
         return False, True, '', '', False, ''
 
     # Open combine stations #0008
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(n_clicks, is_open) {
+            return n_clicks ? !is_open : is_open;
+        }
+        """,
         Output(component_id='modal_combine_stations', component_property='is_open'),
         Input(component_id='combine-stations', component_property='n_clicks'),
         State('modal_combine_stations', 'is_open')
     )
-    def open_create_files(n_clicks, is_open) -> bool:
-        """
-        Input: Click on the 'combine stations' button and information, if the modal ist open
-        Output: boolean, if the modal is open
-
-        Opens the modal 'create files'
-        """
-
-        if n_clicks:
-            return not is_open
-
-        return is_open
 
     # Info combine stations #0009
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(n_clicks) {
+            return Boolean(n_clicks);
+        }
+        """,
         Output(component_id='combine_stations_info', component_property='displayed'),
         Input(component_id='cs_info', component_property='n_clicks')
     )
-    def info_combine_stations(n_clicks) -> bool:
-        """
-        Input: Click on the 'info' button
-        Output: boolean, if the modal is open
-
-        Opens the window 'combine stations info'
-        """
-
-        if n_clicks:
-            return True
-
-        return False
 
     # Combine stations #0010
     @app.callback(
@@ -405,9 +431,9 @@ def dp_callbacks(app):
          Output(component_id='cs_station_2', component_property='value'),
          Output(component_id='combine_stations_alert', component_property='displayed'),
          Output(component_id='combine_stations_alert', component_property='message')],
-        [Input(component_id='cs_save', component_property='n_clicks'),
-         Input(component_id='cs_station_1', component_property='value'),
-         Input(component_id='cs_station_2', component_property='value')]
+        Input(component_id='cs_save', component_property='n_clicks'),
+        [State(component_id='cs_station_1', component_property='value'),
+         State(component_id='cs_station_2', component_property='value')]
     )
     def combine_stations(n_clicks, station_1, station_2) -> tuple:
         """
@@ -418,14 +444,11 @@ def dp_callbacks(app):
         and replaced by the station from the first field.
         """
 
-        global count_combine_stations
+        global process_version
 
-        if not count_combine_stations < n_clicks:
+        if not n_clicks:
             raise PreventUpdate
 
-        # Update click count
-        count_combine_stations += 1
-
         # Format user input
         user_input: Dict[str, str] = {
             'station name (1)': station_1,
@@ -434,13 +457,14 @@ def dp_callbacks(app):
 
         # check if the input is valid
         if errors := check(process_data, user_input):
-            error_msg = "ERROR: \n" + ''.join(str(i + 1) + ". " + error + "\n" for i, error in enumerate(errors))
+            error_msg = format_errors(errors)
 
             return station_1, station_2, True, error_msg
 
         # Get station indices
-        index_1: int = station_by_name(process_data['station'], station_1)
-        index_2: int = station_by_name(process_data['station'], station_2)
+        station_index: Dict[str, int] = get_name_index()[0]
+        index_1: int = station_index.get(station_1, -1)
+        index_2: int = station_index.get(station_2, -1)
 
         # check if the given stations exist
         if index_1 == -1 or index_2 == -1:
@@ -450,9 +474,10 @@ def dp_callbacks(app):
         del process_data['station'][index_2]
 
         # replace station_2 in the station of the corresponding order
-        indices: List[tuple] = order_by_station(process_data['order'], station_2)
+        indices: List[tuple] = get_order_station(station_2)
         for index in indices:
             process_data['order'][index[0]]['station'][index[1]] = station_1
+        process_version += 1
 
         return '', '', False, ''
 
@@ -489,37 +514,34 @@ def dp_callbacks(app):
         global curr_dia
 
         # Differentiate which input was triggered
-        ctx = callback_context
-        nu = no_update
-        if not ctx.triggered:
-            button_id = ''
-        else:
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
+        button_id: str = triggered_id()
 
         # If a station attribute is to be added, the current dialog is 'closed' temporarily
         if button_id == 'add_attribute_station':
             curr_dia = ('station', tapped_node['id'])
-            return (False,) + (nu, ) * 12
+            return station_dialog_closed
 
         # If an order attribute is to be added, the current dialog is 'closed' temporarily
         if button_id == 'add_attribute_order':
             curr_dia = ('order', tapped_node['id'])
-            return (nu,) + (False,) + (nu, ) * 11
+            return order_dialog_closed
 
         # If the attribute was saved, then the previously closed window will be opened again
         if button_id == 'add_attribute_save':
             if curr_dia[0] == 'station':
-                return (True,) + (nu,) * 12
+                return station_dialog_opened
             elif curr_dia[0] == 'order':
-                return (nu, ) + (True,) + (nu, ) * 11
+                return order_dialog_opened
 
-            return (nu, ) * 13
+            return dialogs_unchanged
 
         # Start the app
         if tapped_node is None:
             raise PreventUpdate
 
-        if (index := station_by_name(process_data['station'], tapped_node['id'])) != -1:
+        station_index, order_index = get_name_index()
+
+        if (index := station_index.get(tapped_node['id'], -1)) != -1:
             # Case: station
 
             pd = process_data['station'][index]
@@ -529,19 +551,21 @@ def dp_callbacks(app):
             s_capacity: str = pd['capacity']
             s_storage: str = pd['storage'] if pd['storage'] else ''
             measurement: int = int(pd['measurement'])
-            dd_options: list = change_station_dropdown(process_data['order'], tapped_node['id'])
+            order_station: List[tuple] = get_order_station(s_name)
+            dd_options: list = cached_result(('station dropdown', s_name), change_station_dropdown,
+                                             process_data['order'], order_station)
 
             # Prepare the cache variable
             global cache_order, selected_station
-            cache_order = get_cache_order(process_data, s_name)
+            cache_order = get_cache_order(process_data, order_station)
             selected_station = s_name
 
             return True, False, s_name, s_capacity, s_storage, measurement, dd_options, '', '', '', '', '', ''
 
-        elif (order_index := order_by_name(process_data['order'], tapped_node['id'])) != -1:
+        elif (index := order_index.get(tapped_node['id'], -1)) != -1:
             # Case: final-store
 
-            pd = process_data['order'][order_index]
+            pd = process_data['order'][index]
 
             o_name: str = pd['name']
             num_station: str = str(len(pd['station']))
@@ -557,12 +581,12 @@ def dp_callbacks(app):
         [Output(component_id='change_order_alert', component_property='displayed'),
          Output(component_id='change_order_alert', component_property='message'),
          Output(component_id='saved_change_o', component_property='is_open')],
-        [Input(component_id='submit_change_order', component_property='n_clicks'),
-         Input(component_id='order_priority_input_', component_property='value'),
-         Input(component_id='order_storage_input_', component_property='value'),
-         Input(component_id='order_source_input_', component_property='value'),
-         Input(component_id='order_sink_input_', component_property='value'),
-         Input(component_id='order_name_input_', component_property='children')]
+        Input(component_id='submit_change_order', component_property='n_clicks'),
+        [State(component_id='order_priority_input_', component_property='value'),
+         State(component_id='order_storage_input_', component_property='value'),
+         State(component_id='order_source_input_', component_property='value'),
+         State(component_id='order_sink_input_', component_property='value'),
+         State(component_id='order_name_input_', component_property='children')]
     )
     def change_order(n_clicks, priority, storage, source_name, sink_name, order_name) -> tuple:
         """
@@ -572,15 +596,12 @@ def dp_callbacks(app):
         Checks, if the user input is valid. If so, the input is added to process_data
         """
 
-        global count_change_order
+        global process_version
 
         # Starting the ap
-        if not count_change_order < n_clicks:
+        if not n_clicks:
             raise PreventUpdate
 
-        # Update page counter
-        count_change_order += 1
-
         # Check if the input is valid
         user_input: Dict[str, str] = {
             'priority': priority,
@@ -591,11 +612,11 @@ def dp_callbacks(app):
 
         # Check if the user input is valid
         if errors := check(process_data, user_input):
-            error_msg = "ERROR: \n" + ''.join(str(i + 1) + ". " + error + "\n" for i, error in enumerate(errors))
+            error_msg = format_errors(errors)
             return True, error_msg, False
 
         # Get the index of the selected order
-        index_order: int = order_by_name(process_data['order'], order_name)
+        index_order: int = get_name_index()[1].get(order_name, -1)
 
         # Get the selected order dict by index
         order = process_data['order'][index_order]
@@ -605,37 +626,31 @@ def dp_callbacks(app):
         order['storage'] = int(storage) if storage else None
         order['source'] = source_name
         order['sink'] = sink_name if sink_name else None
+        process_version += 1
 
         return False, '', True
 
     # Info change order #0013
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(n_clicks) {
+            return Boolean(n_clicks);
+        }
+        """,
         Output(component_id='change_order_info', component_property='displayed'),
         Input(component_id='info_change_order', component_property='n_clicks')
     )
-    def change_order_info(n_clicks) -> bool:
-        """
-        Input: Click on the 'info' button
-        Output: boolean, if the modal is open
-
-        Opens the window 'change order info'
-        """
-
-        if not n_clicks:
-            return False
-
-        return True
 
     # Change station #0014
     @app.callback(
         [Output(component_id='change_station_alert', component_property='displayed'),
          Output(component_id='change_station_alert', component_property='message'),
          Output(component_id='saved_change_s', component_property='is_open')],
-        [Input(component_id='submit_change_station', component_property='n_clicks'),
-         Input(component_id='station_name_input', component_property='value'),
-         Input(component_id='station_capacity_input', component_property='value'),
-         Input(component_id='station_storage_input', component_property='value'),
-         Input(component_id='station_measurement_input', component_property='value')]
+        Input(component_id='submit_change_station', component_property='n_clicks'),
+        [State(component_id='station_name_input', component_property='value'),
+         State(component_id='station_capacity_input', component_property='value'),
+         State(component_id='station_storage_input', component_property='value'),
+         State(component_id='station_measurement_input', component_property='value')]
     )
     def change_station_main(n_clicks, station_name, capacity, storage, measurement) -> tuple:
         """
@@ -646,15 +661,12 @@ def dp_callbacks(app):
         Therefore, there is another callback 'change_station_sub', in which additional station-properties are set.
         """
 
-        global count_change_station, cache_order
+        global cache_order, process_version
 
         # Starting the ap
-        if not count_change_station < n_clicks:
+        if not n_clicks:
             raise PreventUpdate
 
-        # Update page counter
-        count_change_station += 1
-
         # Check if the input is valid ()
         user_input: Dict[str, str] = {
             'station name': station_name,
@@ -664,7 +676,7 @@ def dp_callbacks(app):
         }
 
         # Check the direct input
-        station_index: int = station_by_name(process_data['station'], selected_station)
+        station_index: int = get_name_index()[0].get(selected_station, -1)
         errors = check(process_data, user_input, station_index=station_index)
 
         # Check the cached data
@@ -678,22 +690,15 @@ def dp_callbacks(app):
                 errors += check(process_data, {'demand': str(value['demand'])})
 
             if value['last_selected'] == 'c':
-                comp = value['component']
-
                 # Delete entry's with no content
-                comp.pop('', None)
-                delete_key = []
-                for c, d in comp.items():
-                    if d == '':
-                        delete_key.append(c)
-                for key in delete_key:
-                    comp.pop(key, None)
+                comp = {c: d for c, d in value['component'].items() if c and d != ''}
+                value['component'] = comp
 
                 errors += check(process_data, {'demand': str(i) for i in comp.values()})
 
         # Check if the user input is valid
         if errors:
-            error_msg = "ERROR: \n" + ''.join(str(i + 1) + ". " + error + "\n" for i, error in enumerate(errors))
+            error_msg = format_errors(errors)
             return True, error_msg, False,
 
         # Get the selected station dict by index
@@ -707,15 +712,20 @@ def dp_callbacks(app):
 
         # Update the station attribute of all involved orders
         orders = process_data['order']
-        order_station: List[tuple] = order_by_station(orders, selected_station)
+        order_station: List[tuple] = get_order_station(selected_station)
         for o_index, s_index in order_station:
             orders[o_index]['station'][s_index] = station_name
 
+        # Index of the selected station in each involved order (taken before the station was renamed)
+        station_in_order: Dict[int, int] = dict(order_station)
+        order_index_by_name: Dict[str, int] = get_name_index()[1]
+
         # Update cached data
         for order, data in cache_order.items():
 
             # Get the index of the selected station and the current order
-            order_index, station_index = order_and_station(process_data['order'], order, selected_station)
+            order_index: int = order_index_by_name[order]
+            station_index: int = station_in_order[order_index]
 
             # Update function
             process_data['order'][order_index]['function'][station_index] = data['function']
@@ -737,6 +747,7 @@ def dp_callbacks(app):
 
         # clear caches
         cache_order = {}
+        process_version += 1
 
         return False, '', True
 
@@ -756,13 +767,11 @@ def dp_callbacks(app):
          Input(component_id='station_cd_input', component_property='data'),
          Input(component_id='add_row_order', component_property='n_clicks'),
          Input(component_id='station_function_input', component_property='value')],
-        [State(component_id='station_demand_div', component_property='style'),
-         State(component_id='station_component_div', component_property='style'),
-         State(component_id='station_cd_input', component_property='dropdown'),
+        [State(component_id='station_cd_input', component_property='dropdown'),
          State(component_id='station_demand_input', component_property='value')]
     )
-    def change_station_sub(tapped_node, selected_order, radio_btn, demand, data, n_click, function_, style_demand,
-                           style_comp, dd_opt, curr_demand) -> tuple:
+    def change_station_sub(tapped_node, selected_order, radio_btn, demand, data, n_click, function_, dd_opt,
+                           curr_demand) -> tuple:
         """
         Input: Tapped node, input-boxes for the station properties to be set
         Output: Input-boxes for the station properties to be set (reset them after valid input)
@@ -770,20 +779,12 @@ def dp_callbacks(app):
         Caches the user input and assigns it to 'process_data' after saving.
         """
 
-        nu = no_update
-        style_show = {'margin-top': '7px'}
-        style_hide = {'margin-top': '7px', 'display': 'none'}
-
         # Differentiate which input was triggered
-        ctx = callback_context
-        if not ctx.triggered:
-            button_id = ''
-        else:
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
+        button_id: str = triggered_id()
 
         # When the user selects a node from the Graph, the sub dialog boxes should all be set to their default value.
         if button_id == 'cytoscape':
-            return None, '', style_show, '', style_hide, {}, [], 'machining'
+            return None, '', param_style_show, '', param_style_hide, {}, [], 'machining'
 
         # When the user selects an order in the dropdown option, the following fields should be filled with the current
         # content belonging to this order
@@ -791,15 +792,16 @@ def dp_callbacks(app):
 
             # The user goes back to the default selection himself
             if selected_order is None:
-                return None, '', style_demand, '', style_comp, {}, [], radio_btn
+                return None, '', nu, '', nu, {}, [], radio_btn
 
             cache = cache_order[selected_order]
             function = cache['function']
             demand = cache['demand']
-            dropdown_opt = create_table_dropdown(process_data['order'], selected_order)
-            data = [{'component': component, 'demand': demand} for component, demand in cache['component'].items()]
+            dropdown_opt = cached_result(('dropdown', selected_order), create_table_dropdown, process_data['order'],
+                                         selected_order)
+            data = component_rows(cache['component'])
 
-            return selected_order, function, style_demand, demand, style_comp, dropdown_opt, data, radio_btn
+            return selected_order, function, nu, demand, nu, dropdown_opt, data, radio_btn
 
         # The user switches from machining to assembly or vice versa
         if button_id == 'station_radio_input':
@@ -810,25 +812,26 @@ def dp_callbacks(app):
                 if selected_order is not None:
                     demand = cache_order[selected_order]['demand']
                     so = selected_order
-                return so, function_, style_show, demand, style_hide, {}, [], radio_btn
+                return so, function_, param_style_show, demand, param_style_hide, {}, [], radio_btn
 
             else:
                 dropdown_opt = {}
                 data = []
                 so = None
                 if selected_order is not None:
-                    dropdown_opt = create_table_dropdown(process_data['order'], selected_order)
-                    data = [{'component': component, 'demand': demand}
-                            for component, demand in cache_order[selected_order]['component'].items()]
+                    cache = cache_order[selected_order]
+                    dropdown_opt = cached_result(('dropdown', selected_order), create_table_dropdown,
+                                                 process_data['order'], selected_order)
+                    data = component_rows(cache['component'])
                     so = selected_order
-                return so, function_, style_hide, '', style_show, dropdown_opt, data, radio_btn
+                return so, function_, param_style_hide, '', param_style_show, dropdown_opt, data, radio_btn
 
         # Demand
         if button_id == 'station_demand_input':
 
             # No order is selected
             if selected_order is None:
-                return None, function_, style_demand, curr_demand, style_comp, {}, [], radio_btn
+                return None, function_, nu, curr_demand, nu, {}, [], radio_btn
 
             cache = cache_order[selected_order]
             cache['last_selected'] = 'd'
@@ -841,13 +844,11 @@ def dp_callbacks(app):
 
             # No order is selected
             if selected_order is None:
-                return None, '', style_demand, '', style_comp, {}, [], radio_btn
+                return None, '', nu, '', nu, {}, [], radio_btn
 
-            cache_order[selected_order]['last_selected'] = 'c'
-            new_component = {}
-            for entry in data:
-                new_component[entry['component']] = entry['demand']
-            cache_order[selected_order]['component'] = new_component
+            cache = cache_order[selected_order]
+            cache['last_selected'] = 'c'
+            cache['component'] = {entry['component']: entry['demand'] for entry in data}
             raise PreventUpdate
 
         # Add row
@@ -858,7 +859,7 @@ def dp_callbacks(app):
 
             # Add an empty row to the table
             new_data = data + [{'component': '', 'demand': ''}]
-            return selected_order, function_, style_demand, '', style_comp, dd_opt, new_data, radio_btn
+            return selected_order, function_, nu, '', nu, dd_opt, new_data, radio_btn
 
         # Function
         if button_id == 'station_function_input':
@@ -867,7 +868,7 @@ def dp_callbacks(app):
                 raise PreventUpdate
 
             cache_order[selected_order]['function'] = function_
-            return selected_order, function_, style_demand, curr_demand, style_comp, dd_opt, data, radio_btn
+            return selected_order, function_, nu, curr_demand, nu, dd_opt, data, radio_btn
 
         return nu, '', nu, '', nu, {}, [], nu
 
@@ -911,50 +912,41 @@ def dp_callbacks(app):
         """
 
         # Global reference
-        global curr_dia
-
-        # Lazy return
-        nu = no_update
+        global curr_dia, process_version
 
         # Style variables
-        style_hide = {
-            'margin-top': '7px',
-            'display': 'none'
-        }
         txt_1: str = ''
         txt_2: str = ''
-        style_1: Dict[str, str] = style_hide
-        style_2: Dict[str, str] = style_hide
+        style_1: Dict[str, str] = param_style_hide
+        style_2: Dict[str, str] = param_style_hide
 
         # Differentiate which input was triggered
-        ctx = callback_context
-        if not ctx.triggered:
-            button_id = ''
-        else:
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
+        button_id: str = triggered_id()
 
         # Fill attribute table with default values, when opening new dialog
         if button_id == 'cytoscape':
 
-            if (index := station_by_name(process_data['station'], tapped_node['id'])) != -1:
-                attr_table = get_attributes(process_data['station'][index], 'station')
-                return False, '', '', style_hide, style_hide, False, '', attr_table, nu, nu, nu, nu, nu, nu
+            station_index, order_index = get_name_index()
 
-            elif (order_index := order_by_name(process_data['order'], tapped_node['id'])) != -1:
-                attr_table = get_attributes(process_data['order'][index], 'order')
-                return False, '', '', style_hide, style_hide, False, '', nu, attr_table, nu, nu, nu, nu, nu
+            if (index := station_index.get(tapped_node['id'], -1)) != -1:
+                attr_table = cached_result(('station', index), get_attributes, process_data['station'][index],
+                                           'station')
+                return False, '', '', param_style_hide, param_style_hide, False, '', attr_table, nu, nu, nu, nu, nu, nu
+
+            elif (index := order_index.get(tapped_node['id'], -1)) != -1:
+                attr_table = cached_result(('order', index), get_attributes, process_data['order'][index], 'order')
+                return False, '', '', param_style_hide, param_style_hide, False, '', nu, attr_table, nu, nu, nu, nu, nu
 
         # Fill attribute table with default values, when opening new dialog
         if button_id == 'add_attribute_factory':
-            attr_table = get_attributes(process_data['factory'], 'factory')
-            return True, txt_1, txt_2, style_hide, style_hide, False, '', nu, nu, attr_table, '', '', '', ''
+            attr_table = cached_result(('factory',), get_attributes, process_data['factory'], 'factory')
+            return True, txt_1, txt_2, param_style_hide, param_style_hide, False, '', nu, nu, attr_table, '', '', '', ''
 
         # Select distribution
-        if button_id == 'attr_dist_input':
+        if dist or button_id == 'attr_dist_input':
             txt_1, txt_2, style_1, style_2 = select_distribution(dist)
+        if button_id == 'attr_dist_input':
             return nu, txt_1, txt_2, style_1, style_2, False, '', nu, nu, nu, nu, nu, nu, nu
-        elif dist:
-            txt_1, txt_2, style_1, style_2 = select_distribution(dist)
 
         # Open dialog
         if button_id in ['add_attribute_station', 'add_attribute_order']:
@@ -967,49 +959,50 @@ def dp_callbacks(app):
             # Open error-dialog, if the input is not valid
             if errors := (check_dist_param(dist, param1, param2) +
                           check(process_data, {'attr. name': attr_name, 'distribution': dist})):
-                error_msg = "ERROR: \n" + ''.join(str(i + 1) + ". " + error + "\n" for i, error in enumerate(errors))
+                error_msg = format_errors(errors)
 
                 return False, txt_1, txt_2, style_1, style_2, True, error_msg, nu, nu, nu, nu, nu, nu, nu
 
-            # Find index of element, the attribute is to be added
-            insert_index: int = find_element_index(process_data, curr_dia)
+            # Find index of element, the attribute is to be added (-1: factory)
+            insert_index: int = -1
+            if curr_dia[0] == 'station':
+                insert_index = get_name_index()[0][curr_dia[1]]
+            elif curr_dia[0] == 'order':
+                insert_index = get_name_index()[1][curr_dia[1]]
 
             # Add the attribute to the corresponding simulation object (override if already defined)
             dist_list: list = create_dist_list(dist, param1, param2)
-            new_data = [{'name': attr_name, 'distribution.': dist, 'parameter': str(dist_list)}]
+            new_row = {'name': attr_name, 'distribution.': dist, 'parameter': str(dist_list)}
+            process_version += 1
             if insert_index == -1:
                 process_data['factory'][attr_name] = dist_list
-                return_data = factory_data + new_data
-                return False, '', '', style_hide, style_hide, False, '', nu, nu, return_data, nu, nu, nu, nu
+                factory_data.append(new_row)
+                return False, '', '', param_style_hide, param_style_hide, False, '', \
+                    nu, nu, factory_data, nu, nu, nu, nu
             elif curr_dia[0] == 'station':
                 process_data['station'][insert_index][attr_name] = dist_list
-                return_data = station_data + new_data
-                return False, '', '', style_hide, style_hide, False, '', return_data, nu, nu, nu, nu, nu, nu
+                station_data.append(new_row)
+                return False, '', '', param_style_hide, param_style_hide, False, '', \
+                    station_data, nu, nu, nu, nu, nu, nu
             elif curr_dia[0] == 'order':
                 process_data['order'][insert_index][attr_name] = dist_list
-                return_data = order_data + new_data
-                return False, '', '', style_hide, style_hide, False, '', nu, return_data, nu, nu, nu, nu, nu
+                order_data.append(new_row)
+                return False, '', '', param_style_hide, param_style_hide, False, '', \
+                    nu, order_data, nu, nu, nu, nu, nu
 
             # return -> just causing a side effect
         return False, txt_1, txt_2, style_1, style_2, False, '', nu, nu, nu, nu, nu, nu, nu
 
     # Info add attribute #0016
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(n_clicks) {
+            return Boolean(n_clicks);
+        }
+        """,
         Output(component_id='cfd_add_attribute_info', component_property='displayed'),
         Input(component_id='add_attribute_info', component_property='n_clicks')
     )
-    def add_attribute_info(n_clicks) -> bool:
-        """
-        Input: Click on the 'info' button
-        Output: boolean, if the modal is open
-
-        Opens the window 'add attribute info'
-        """
-
-        if not n_clicks:
-            return False
-
-        return True
 
     # Edit factory #0017
     @app.callback(
@@ -1033,16 +1026,10 @@ def dp_callbacks(app):
 
         """
 
-        nu = no_update
-
-        global curr_dia
+        global curr_dia, process_version
 
         # Differentiate which input was triggered
-        ctx = callback_context
-        if not ctx.triggered:
-            button_id = ''
-        else:
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
+        button_id: str = triggered_id()
 
         # Open Dialog
         if button_id == 'edit-factory':
@@ -1068,12 +1055,13 @@ def dp_callbacks(app):
 
             # Open error-dialog, if the input is not valid
             if errors := check(process_data, {'global function': func_name}):
-                error_msg = "ERROR: \n" + ''.join(str(i + 1) + ". " + error + "\n" for i, error in enumerate(errors))
+                error_msg = format_errors(errors)
 
                 return True, nu, nu, True, error_msg
 
             # Add the function name to the local process data
             process_data['factory']['function'] += [func_name]
+            process_version += 1
 
             # Add the function name to the table
             new_func = curr_func + [{'name': func_name}]
@@ -1084,19 +1072,12 @@ def dp_callbacks(app):
         return False, nu, nu, nu, nu
 
     # Info edit factory #0018
-    @app.callback(
+    app.clientside_callback(
+        """
+        function(n_clicks) {
+            return Boolean(n_clicks);
+        }
+        """,
         Output(component_id='cfd_edit_factory_info', component_property='displayed'),
         Input(component_id='info_edit_factory', component_property='n_clicks')
     )
-    def info_edit_factory(n_clicks) -> bool:
-        """
-        Input: Click on the 'info' button
-        Output: boolean, if the modal is open
-
-        Opens the window 'edit factory info'
-        """
-
-        if n_clicks:
-            return True
-
-        return False
@@ -8,22 +8,80 @@ a callback function.
 # root_nodes              #0001
 # check                   #0002
 # txt_python_func         #0003
-# station_by_name         #0004
-# order_by_station        #0005
+# station_occurrences     #0005
 # change_station_dropdown #0006
-# order_by_name           #0007
 # get_cache_order         #0008
-# order_and_station       #0009
 # create_table_dropdown   #0010
 # select_distribution     #0011
 # check_dist_param        #0012
-# find_element_index      #0013
 # create_dist_list        #0014
 # get_attributes          #0015
 # clear_process_data      #0016
+# name_index              #0017
+# format_errors           #0018
+# component_rows          #0019
 
 from typing import List, Dict, Tuple
 
+# Keys of the user input, whose value must be set and must not contain a space (see check)
+required_names = frozenset({'source name', 'path', 'project name', 'station name (1)', 'station name (2)', 'function',
+                            'attr. name'})
+
+# Identifier of each distribution (first element of a distribution list) and the distribution of each identifier
+dist_code: Dict[str, str] = {'fix': 'f', 'binary': 'b', 'binomial': 'i', 'normal': 'n', 'uniform': 'u',
+                             'poisson': 'p', 'exponential': 'e', 'lognormal': 'l', 'chisquare': 'c', 'standard-t': 't'}
+dist_ident: Dict[str, str] = {code: dist for dist, code in dist_code.items()}
+
+# Names of the parameters of each distribution ('' if the distribution has no second parameter)
+dist_param_names: Dict[str, Tuple[str, str]] = {
+    'fix': ('value', ''),
+    'binary': ('probability', ''),
+    'binomial': ('number trials', 'probability'),
+    'normal': ('mean', 'standard dev.'),
+    'uniform': ('lower bound', 'upper bound'),
+    'poisson': ('rate', ''),
+    'exponential': ('scale', ''),
+    'lognormal': ('mean', 'standard dev.'),
+    'chisquare': ('deg. of freedom', ''),
+    'standard-t': ('deg. of freedom', '')
+}
+
+# Keys of a station, an order and the factory, that are no user defined attributes (see get_attributes)
+pre_defined_keys: Dict[str, frozenset] = {
+    'station': frozenset({'name', 'capacity', 'storage', 'measurement'}),
+    'order': frozenset({'name', 'priority', 'storage', 'source', 'sink', 'station', 'function', 'demand', 'component'}),
+    'factory': frozenset({'function'})
+}
+
+# Signature of the user functions by function type (see txt_python_func)
+func_signature: Dict[str, str] = {'p': 'env, item, machine, factory', 's': 'env, factory', 'g': 'env, factory'}
+
+# Checks of the parameters of each distribution (see check_dist_param). Each parameter is described by its type, its
+# name, a function that receives the parsed parameters and returns whether the last one is invalid, and the error
+# message
+dist_param_rules: Dict[str, List[tuple]] = {
+    'fix': [('float', 'Value', None, '')],
+    'binary': [('float', 'Success probability', lambda v: v[0] > 1 or v[0] < 0,
+                "Success probability is not between 0.0 and 1.0")],
+    'binomial': [('int', 'Number Trails', lambda v: v[0] <= 0, "Number trails is not a positive integer"),
+                 ('float', 'Probability', lambda v: v[1] > 1 or v[1] < 0, "Probability is not between 0.0 and 1.0")],
+    'normal': [('float', 'Mean', None, ''),
+               ('float', 'Standard dev.', lambda v: v[1] < 0, "Standard dev. is not greater/equal then 0.0")],
+    'uniform': [('float', 'Lower bound', None, ''),
+                ('float', 'Upper bound', lambda v: v[1] < v[0], "Lower bound is greater then upper bound")],
+    'poisson': [('float', 'Rate', lambda v: v[0] <= 0, "Rate is not greater then zero")],
+    'exponential': [('float', 'Scale', lambda v: v[0] <= 0, "Scale is less/equal then zero")],
+    'lognormal': [('float', 'Mean', None, ''),
+                  ('float', 'Standard dev.', lambda v: v[1] <= 0, "Standard dev. is less then or equal to zero")],
+    'chisquare': [('float', 'Deg. of freedom', lambda v: v[0] <= 0, "Deg. of freedom is less/equal then zero")],
+    'standard-t': [('float', 'Deg. of freedom', lambda v: v[0] <= 0, "Deg. of freedom is less/equal then zero")]
+}
+
+# Styles to show or hide the input field of a distribution parameter
+param_style_show: Dict[str, str] = {'margin-top': '7px'}
+param_style_hide: Dict[str, str] = {'margin-top': '7px', 'display': 'none'}
+
+
 # root_nodes #0001
 def root_nodes(order_list: List[dict]) -> str:
     """Defining the root nodes to arrange the nodes based on them in a tree structure
@@ -32,36 +90,25 @@ def root_nodes(order_list: List[dict]) -> str:
 
     """
 
-    # Get all orders, which have at least one station
-    order_with_process: List[dict] = list(order for order in order_list if len(order['station']) > 0)
-
-    # List of all jobs whose first station is a root node
-    first_station_name: List[str] = []
-
-    # Filtering of all stations names that are in the first position in the process and do not perform assembly
-    for order_data in order_with_process:
-        if isinstance(order_data['demand'][0], list):
-            continue
-        first_station_name.append(order_data['station'][0])
-    first_station_name = list(set(first_station_name))
+    # Station names that are in the first position of a process and do not perform assembly (in order of appearance)
+    first_station_name: Dict[str, None] = dict.fromkeys(
+        order_data['station'][0] for order_data in order_list
+        if order_data['station'] and not isinstance(order_data['demand'][0], list)
+    )
 
-    # Remove all station names whose stations are not in the first place with respect to another process.
+    # Station names that are not in the first place with respect to another process. Only exception: in the process
+    # where the station is again appearance is also the process where the station is in the first place
+    later_station_name: set = set()
     for order_data in order_list:
         for station in order_data['station'][1:]:
-            if station in first_station_name:
-                if station == order_data['station'][0]:
-                    # Only exception: in the process where the station is again appearance is also the process where
-                    # the station is in the first place
-                    continue
-                first_station_name.remove(station)
+            if station != order_data['station'][0]:
+                later_station_name.add(station)
+
+    root_station_name: List[str] = [station for station in first_station_name if station not in later_station_name]
 
     # According to the library dash_cytoscape the following syntax must be used regarding the root nodes
     # '#root_name_1, #root_name_2, ... #root_name_n'
-    roots: str = ''
-    for station_name in first_station_name:
-        roots += '#' + station_name + ', '
-
-    return roots.strip(', ')
+    return ', '.join('#' + station_name for station_name in root_station_name)
 
 
 # check #0002
@@ -86,13 +133,15 @@ def check(process_data: dict, user_input: Dict[str, str], order_index: int = Non
     12. 'demand' -> Demand
     13. 'attr. name' -> Name of station, order and factory attributes
     14. 'distribution' -> Distribution name of an attribute
+
+    All keys in required_names are checked in the same way: a value must be set and must not contain a space.
     """
 
     error_list: List[str] = []
 
     for key, value in user_input.items():
 
-        if key == 'order name':
+        if key in required_names:
 
             # Was a name set
             if value is None or value == '':
@@ -103,14 +152,7 @@ def check(process_data: dict, user_input: Dict[str, str], order_index: int = Non
             if ' ' in value:
                 error_list.append(f"The {key} contains a space")
 
-            # Name taken
-            for index, order in enumerate(process_data['order']):
-                if order_index is not None and index == order_index:
-                    continue
-                if value == order['name']:
-                    error_list.append(f"The {key} is already taken")
-
-        elif key == 'source name':
+        elif key == 'order name':
 
             # Was a name set
             if value is None or value == '':
@@ -121,6 +163,13 @@ def check(process_data: dict, user_input: Dict[str, str], order_index: int = Non
             if ' ' in value:
                 error_list.append(f"The {key} contains a space")
 
+            # Name taken
+            for index, order in enumerate(process_data['order']):
+                if order_index is not None and index == order_index:
+                    continue
+                if value == order['name']:
+                    error_list.append(f"The {key} is already taken")
+
         elif key == 'sink name':
 
             # The sink is an optional parameter
@@ -162,39 +211,6 @@ def check(process_data: dict, user_input: Dict[str, str], order_index: int = Non
             if not value.isdigit():
                 error_list.append(f"{key} is not a positive integer")
 
-        elif key == 'path':
-
-            # Was a path set
-            if value is None or value == '':
-                error_list.append(f"No {key} was set")
-                continue
-
-            # Path with space
-            if ' ' in value:
-                error_list.append(f"The {key} contains a space")
-
-        elif key == 'project name':
-
-            # Was a project set
-            if value is None or value == '':
-                error_list.append(f"No {key} was set")
-                continue
-
-            # Project name with space
-            if ' ' in value:
-                error_list.append(f"The {key} contains a space")
-
-        elif key == 'station name (1)' or key == 'station name (2)':
-
-            # Was a name set
-            if value is None or value == '':
-                error_list.append(f"No {key} was set")
-                continue
-
-            # Name with space
-            if ' ' in value:
-                error_list.append(f"The {key} contains a space")
-
         elif key == 'station name':
 
             # Was a name set
@@ -231,17 +247,6 @@ def check(process_data: dict, user_input: Dict[str, str], order_index: int = Non
             if value not in ['0', '1']:
                 error_list.append(f"No {key} state is selected")
 
-        elif key == 'function':
-
-            # Was a function set
-            if value is None or value == '':
-                error_list.append(f"No {key} was set")
-                continue
-
-            # Function with space
-            if ' ' in value:
-                error_list.append(f"The {key} contains a space")
-
         elif key == 'demand':
 
             # The demand is not an optional parameter
@@ -256,17 +261,6 @@ def check(process_data: dict, user_input: Dict[str, str], order_index: int = Non
             if value == '0':
                 error_list.append(f"A {key} is not greater than zero")
 
-        elif key == 'attr. name':
-
-            # Was a name set
-            if value is None or value == '':
-                error_list.append(f"No {key} was set")
-                continue
-
-            # Name with space
-            if ' ' in value:
-                error_list.append(f"The {key} contains a space")
-
         elif key == 'global function':
 
             # Was a function set
@@ -302,92 +296,54 @@ def txt_python_func(func_list: List[str], func_type: str) -> str:
     'g' -> global functions
     """
 
-    # Make a list of unique elements
-    func_list = list(set(func_list))
-
-    # Create functions signature based on the function type
-    signature: str = ''
-    if func_type == 'p':
-        signature = 'env, item, machine, factory'
-    elif func_type == 's':
-        signature = 'env, factory'
-    elif func_type == 'g':
-        signature = 'env, factory'
+    signature: str = func_signature.get(func_type, '')
 
-    txt_func: str = ''
-    for func in func_list:
-        txt_func += 'def ' + func + '(' + signature + '):\n\n\tpass\n\n'
+    # Each function is written once, in the order of its first occurrence
+    return ''.join('def ' + func + '(' + signature + '):\n\n\tpass\n\n' for func in dict.fromkeys(func_list))
 
-    return txt_func
 
-
-# station_by_name #0004
-def station_by_name(station_list: List[dict], station_name: str) -> int:
-    """Returns the current index of a station. The starting point is the name of the station. If no station with this
-    name exists, -1 is returned.
+# station_occurrences #0005
+def station_occurrences(order_list: List[Dict]) -> Dict[str, List[tuple]]:
+    """Returns a dict, that maps the name of each station to a list of tuples. The first element of each tuple contains
+    the index of an order that contains the station. The second element is the respective index in the station list of
+    the order (its first occurrence). Since a station can be used by several orders, these tuples are stored in a list.
     """
 
-    for index, station in enumerate(station_list):
-        if station['name'] == station_name:
-            return index
-
-    return -1
+    occurrences: Dict[str, List[tuple]] = {}
 
+    for o_index, order in enumerate(order_list):
+        for s_index, station_name in enumerate(order['station']):
+            indices: List[tuple] = occurrences.setdefault(station_name, [])
+            if not indices or indices[-1][0] != o_index:
+                indices.append((o_index, s_index))
 
-# order_by_station #0005
-def order_by_station(order_list: List[Dict], station_name) -> List[tuple]:
-    """Returns a list of tuples. The first element of each tuple contains the index of an order that contains the
-    station 'station_name'. The second element is the respective index in the station list of the order. Since a station
-    can be used by several orders, these tuples are stored in a list.
-    """
-
-    indices: List[tuple] = []
-
-    for index, order in enumerate(order_list):
-        if station_name in order['station']:
-            indices.append((index, order['station'].index(station_name)))
-
-    return indices
+    return occurrences
 
 
 # change_station_dropdown #0006
-def change_station_dropdown(order_list: List[dict], station_name: str) -> List[dict]:
+def change_station_dropdown(order_list: List[dict], order_station: List[tuple]) -> List[dict]:
     """
-    This function creates the dropdown options for the 'change station' window. It passes the list of orders and a name
-    of a station. Now a structured output is generated, in which all orders are contained, in which this station occurs.
-    The output has the following structure:
+    This function creates the dropdown options for the 'change station' window. It passes the list of orders and the
+    occurrences of a station in these orders (see station_occurrences). Now a structured output is generated, in which
+    all orders are contained, in which this station occurs. The output has the following structure:
 
     [{'label': 'order_name', 'value': 'order_name'}]
     """
 
     dropdown_opt: List[dict] = []
 
-    for order in order_list:
-        if station_name in order['station']:
-            order_name: str = order['name']
-            dropdown_opt.append({'label': order_name, 'value': order_name})
+    for o_index, _ in order_station:
+        order_name: str = order_list[o_index]['name']
+        dropdown_opt.append({'label': order_name, 'value': order_name})
 
     return dropdown_opt
 
 
-# order_by_name #0007
-def order_by_name(order_list: List[dict], order_name: str) -> int:
-    """This method returns the current index of an order by its name. If the order does not exist, -1 is returned.
-
-    """
-
-    for index, order in enumerate(order_list):
-        if order['name'] == order_name:
-            return index
-
-    return -1
-
-
 # get_cache_order #0008
-def get_cache_order(process_data, station_name):
+def get_cache_order(process_data, order_station: List[tuple]):
     """This method creates a dict intended for caching user input during user interaction. An entry is created for each
-    order in which the passed station occurs. This entry stores the function called in this order, as well as all
-    components to be assembled. The structure is as follows:
+    order in which the station occurs (order_station, see station_occurrences). This entry stores the function called in
+    this order, as well as all components to be assembled. The structure is as follows:
 
     cache_order = {
         'order_1': {
@@ -407,47 +363,22 @@ def get_cache_order(process_data, station_name):
     cache_dict: dict = {}
     orders: List[dict] = process_data['order']
 
-    # Get a list of tuples with indices, in which order and on which place the station occurs
-    order_station = order_by_station(orders, station_name)
-
     for o_index, s_index in order_station:
 
         order: dict = orders[o_index]
         order_name: str = order['name']
 
-        cache_dict[order_name] = {
-            'function': order['function'][s_index]
-        }
+        function: str = order['function'][s_index]
 
         if isinstance(demand := order['demand'][s_index], int):
-            cache_dict[order_name]['demand'] = demand
-            cache_dict[order_name]['component'] = {}
-            cache_dict[order_name]['last_selected'] = 'd'
+            cache_dict[order_name] = {'function': function, 'demand': demand, 'component': {}, 'last_selected': 'd'}
         else:
-            cache_dict[order_name]['component'] = {
-                order['component'][s_index][i]: demand[i] for i in range(len(demand))}
-            cache_dict[order_name]['demand'] = 0
-            cache_dict[order_name]['last_selected'] = 'c'
+            cache_dict[order_name] = {'function': function, 'demand': 0, 'last_selected': 'c',
+                                      'component': dict(zip(order['component'][s_index], demand))}
 
     return cache_dict
 
 
-# order_and_station #0009
-def order_and_station(order_list: List[dict], order_name: str, station_name: str) -> tuple:
-    """ Return an index-tuple containing the index of an order, and the index of a specific station used in it.
-
-    If the order does not exist, or the order does not contain the specific station (-1,-1) ist returned
-    """
-
-    for order_index, order in enumerate(order_list):
-        if order['name'] == order_name:
-            for station_index, station in enumerate(order['station']):
-                if station == station_name:
-                    return order_index, station_index
-
-    return -1, -1
-
-
 # create_table_dropdown #0010
 def create_table_dropdown(order_list: List[dict], order_name: str) -> dict:
     """ Create the dropdown-options in the context of assembling orders.
@@ -455,238 +386,66 @@ def create_table_dropdown(order_list: List[dict], order_name: str) -> dict:
     Syntax of the returned dictionary is based on dash.
     """
 
-    dropdown_options = {
+    options: List[dict] = [{'label': name, 'value': name}
+                           for order in order_list if (name := order['name']) != order_name]
+
+    return {
         'component': {
-            'options': []
+            'options': options
         }
     }
 
-    for order in order_list:
-        if (name := order['name']) != order_name:
-            dropdown_options['component']['options'].append(
-                {
-                    'label': name,
-                    'value': name
-                }
-            )
-
-    return dropdown_options
-
 
 # select_distribution #0011
 def select_distribution(dist: str) -> tuple:
     """ Return a 4-tuple containing names and style information based on a chosen distribution.
 
+    The styles are shared module constants, so the returned dicts must not be modified.
     """
 
-    name_one: str = ''
-    name_two: str = ''
-    style_one: dict = {
-        'margin-top': '7px'
-    }
-    style_two: dict = {
-        'margin-top': '7px'
-    }
-
-    if dist == 'fix':
-
-        name_one = 'value'
-        style_two['display'] = 'none'
-
-    elif dist == 'binary':
-
-        name_one = 'probability'
-        style_two['display'] = 'none'
-
-    elif dist == 'binomial':
-
-        name_one = 'number trials'
-        name_two = 'probability'
-
-    elif dist == 'normal':
-
-        name_one = 'mean'
-        name_two = 'standard dev.'
-
-    elif dist == 'uniform':
-
-        name_one = 'lower bound'
-        name_two = 'upper bound'
+    if dist not in dist_param_names:
+        return '', '', param_style_show, param_style_show
 
-    elif dist == 'poisson':
+    name_one, name_two = dist_param_names[dist]
 
-        name_one = 'rate'
-        style_two['display'] = 'none'
-
-    elif dist == 'exponential':
-
-        name_one = 'scale'
-        style_two['display'] = 'none'
-
-    elif dist == 'lognormal':
-
-        name_one = 'mean'
-        name_two = 'standard dev.'
-
-    elif dist == 'chisquare':
-
-        name_one = 'deg. of freedom'
-        style_two['display'] = 'none'
-
-    elif dist == 'standard-t':
-
-        name_one = 'deg. of freedom'
-        style_two['display'] = 'none'
-
-    return name_one, name_two, style_one, style_two
+    return name_one, name_two, param_style_show, param_style_show if name_two else param_style_hide
 
 
 # check_dist_param #0012
 def check_dist_param(dist: str, param_1: str, param_2: str) -> List[str]:
-    error_list: List[str] = []
     """ Check if the user-input is valid for a chosen distribution.
-    
-    Return a list with error-messages. 
-    """
-
-    def check_param_int(param: str, param_name: str) -> bool:
-
-        if param is None or param == '':
-            error_list.append(f"{param_name} is not set")
-            return True
 
-        if not param.isdigit():
-            error_list.append(f"{param_name} is not an integer")
-            return True
+    Return a list with error-messages. The checks of each distribution are taken from dist_param_rules.
+    """
 
-        return False
+    error_list: List[str] = []
+    values: list = []
 
-    def check_param_float(param: str, param_name: str) -> bool:
+    for param, (kind, param_name, invalid, message) in zip((param_1, param_2), dist_param_rules.get(dist, [])):
 
         if param is None or param == '':
             error_list.append(f"{param_name} is not set")
-            return True
-
-        try:
-            _ = float(param)
-        except ValueError:
-            error_list.append(f"{param_name} is not a float")
-            return True
-
-        return False
-
-    if dist == 'fix':
-
-        if check_param_float(param_1, 'Value'):
-            return error_list
-
-    elif dist == 'binary':
-
-        if check_param_float(param_1, 'Success probability'):
-            return error_list
-
-        if float(param_1) > 1 or float(param_1) < 0:
-            error_list.append("Success probability is not between 0.0 and 1.0")
-
-    elif dist == 'binomial':
-
-        if check_param_int(param_1, 'Number Trails'):
-            return error_list
-
-        if int(param_1) <= 0:
-            error_list.append("Number trails is not a positive integer")
-
-        if check_param_float(param_2, 'Probability'):
-            return error_list
-
-        if float(param_2) > 1 or float(param_2) < 0:
-            error_list.append("Probability is not between 0.0 and ")
-
-    elif dist == 'normal':
-
-        if check_param_float(param_1, 'Mean'):
-            return error_list
-
-        if check_param_float(param_2, 'Standard dev.'):
-            return error_list
-
-        if float(param_2) < 0:
-            error_list.append("Standard dev. is not greater/equal then 0.0")
-
-    elif dist == 'uniform':
-
-        if check_param_float(param_1, 'Lower bound'):
-            return error_list
-
-        if check_param_float(param_2, 'Upper bound'):
-            return error_list
-
-        if float(param_2) < float(param_1):
-            error_list.append("Lower bound is greater then upper bound")
-
-    elif dist == 'poisson':
-
-        if check_param_float(param_1, 'Rate'):
-            return error_list
-
-        if float(param_1) <= 0:
-            error_list.append("Rate is not greater then zero")
-
-    elif dist == 'exponential':
-
-        if check_param_float(param_1, 'Scale'):
-            return error_list
-
-        if float(param_1) <= 0:
-            error_list.append("Scale is less/equal then zero")
-
-    elif dist == 'lognormal':
-
-        if check_param_float(param_1, 'Mean'):
             return error_list
 
-        if check_param_float(param_2, 'Standard dev.'):
-            return error_list
-
-        if float(param_2) <= 0:
-            error_list.append("Standard dev. is less then or equal to zero")
-
-    elif dist == 'chisquare':
-
-        if check_param_float(param_1, 'Deg. of freedom'):
-            return error_list
-
-        if float(param_1) <= 0:
-            error_list.append("Deg. of freedom is less/equal then zero")
-
-    elif dist == 'standard-t':
-
-        if check_param_float(param_1, 'Deg. of freedom'):
-            return error_list
+        # Parse the parameter once, the parsed value is used for the bound check
+        if kind == 'int':
+            if not param.isdigit():
+                error_list.append(f"{param_name} is not an integer")
+                return error_list
+            values.append(int(param))
+        else:
+            try:
+                values.append(float(param))
+            except ValueError:
+                error_list.append(f"{param_name} is not a float")
+                return error_list
 
-        if float(param_1) <= 0:
-            error_list.append("Deg. of freedom is less/equal then zero")
+        if invalid is not None and invalid(values):
+            error_list.append(message)
 
     return error_list
 
 
-# find_element_index #0013
-def find_element_index(process_data: dict, curr_dia: Tuple[str, str]) -> int:
-    """ Find the index of a specific station or order within the process data.
-
-    note: this function is used in a context, where already has been checked, if the searched object exists.
-    """
-
-    if curr_dia[0] == 'factory':
-        return -1
-
-    rel_dict: dict = process_data[curr_dia[0]]
-
-    for index, entry in enumerate(rel_dict):
-        if entry['name'] == curr_dia[1]:
-            return index
-
-
 # create_dist_list #0014
 def create_dist_list(dist: str, param1: str, param2: str) -> list:
     """ Creates a list with a special syntax describing a distribution
@@ -694,97 +453,75 @@ def create_dist_list(dist: str, param1: str, param2: str) -> list:
     Syntax: [identifier, param1, param2 (if necessary)]
     """
 
-    dist_list: list = []
+    if dist not in dist_code:
+        return []
 
-    if dist == 'fix':
+    if dist_param_names[dist][1]:
+        return [dist_code[dist], float(param1), float(param2)]
 
-        dist_list = ["f", float(param1)]
+    return [dist_code[dist], float(param1)]
 
-    elif dist == 'binary':
 
-        dist_list = ["b", float(param1)]
-
-    elif dist == 'binomial':
-
-        dist_list = ["i", float(param1), float(param2)]
-
-    elif dist == 'normal':
+# get_attributes #0015
+def get_attributes(data: dict, case: str) -> List[Dict[str, str]]:
+    """ Get all user defined attributes of an order, station or the factory.
 
-        dist_list = ["n", float(param1), float(param2)]
+    cases: 'station', 'order', 'factory'
+    """
 
-    elif dist == 'uniform':
+    compare: frozenset = pre_defined_keys.get(case, pre_defined_keys['factory'])
 
-        dist_list = ["u", float(param1), float(param2)]
+    return [{'name': key, 'distribution.': dist_ident[value[0]], 'parameter': str(value)}
+            for key, value in data.items() if key not in compare]
 
-    elif dist == 'poisson':
 
-        dist_list = ["p", float(param1)]
+# clear_process_data #0016
+def clear_process_data(process_data) -> dict:
+    """ Create a copy of the process data where all keys with a 'None'-value are removed.
 
-    elif dist == 'exponential':
+    Orders and stations without a 'None'-value are not copied, so the result must only be read.
+    """
 
-        dist_list = ["e", float(param1)]
+    def strip(element: dict) -> dict:
+        if None not in element.values():
+            return element
+        return {k: v for k, v in element.items() if v is not None}
 
-    elif dist == 'lognormal':
+    return {
+        'order': [strip(order) for order in process_data['order']],
+        'station': [strip(station) for station in process_data['station']],
+        'factory': process_data['factory']
+    }
 
-        dist_list = ["l", float(param1), float(param2)]
 
-    elif dist == 'chisquare':
+# name_index #0017
+def name_index(element_list: List[dict]) -> Dict[str, int]:
+    """Returns a dict, that maps the name of each station or order to its index in the given list.
 
-        dist_list = ["c", float(param1)]
+    If several elements have the same name, the first index is kept.
+    """
 
-    elif dist == 'standard-t':
+    index: Dict[str, int] = {}
 
-        dist_list = ["t", float(param1)]
+    for i, element in enumerate(element_list):
+        index.setdefault(element['name'], i)
 
-    return dist_list
+    return index
 
 
-# get_attributes #0015
-def get_attributes(data: dict, case: str) -> List[Dict[str, str]]:
-    """ Get all user defined attributes of an order, station or the factory.
+# format_errors #0018
+def format_errors(errors: List[str]) -> str:
+    """Returns the message for the alert window, in which the errors are listed and numbered.
 
-    cases: 'station', 'order', 'factory'
     """
 
-    res = []
+    return "ERROR: \n" + ''.join([f"{i}. {error}\n" for i, error in enumerate(errors, 1)])
 
-    pre_defined_station = ['name', 'capacity', 'storage', 'measurement']
-    pre_defined_order = ['name', 'priority', 'storage', 'source', 'sink', 'station', 'function', 'demand', 'component']
-    pre_defined_factory = ['function']
 
-    if case == 'station':
-        compare = pre_defined_station
-    elif case == 'order':
-        compare = pre_defined_order
-    else:
-        compare = pre_defined_factory
-
-    dist_ident = {'f': 'fix', 'b': 'binary', 'i': 'binomial', 'n': 'normal', 'u': 'uniform', 'p': 'poisson',
-                  'e': 'exponential', 'l': 'lognormal', 'c': 'chisquare', 't': 'standard-t'}
-
-    for key, value in data.items():
-
-        if key not in compare:
-            res += [{'name': key, 'distribution.': dist_ident[value[0]], 'parameter': str(value)}]
-
-    return res
-
-# clear_process_data #0016
-def clear_process_data(process_data) -> dict:
-    """ Create a copy of the process data where all keys with a 'None'-value are removed.
+# component_rows #0019
+def component_rows(component: Dict[str, int]) -> List[Dict[str, int]]:
+    """Returns the rows of the component table for the cached components of an order.
 
     """
 
-    pd = {
-        'order': [],
-        'station': [],
-        'factory': process_data['factory']
-    }
-
-    for order in process_data['order']:
-        pd['order'].append({k: v for k, v in order.items() if v is not None})
-
-    for station in process_data['station']:
-        pd['station'].append({k: v for k, v in station.items() if v is not None})
-
-    return pd
+    return [{'component': name, 'demand': demand} for name, demand in component.items()]
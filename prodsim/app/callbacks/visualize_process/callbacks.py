@@ -11,7 +11,7 @@ The utilities used, can be found in prodsim.app.callbacks.visualize_process.supp
 
 from __future__ import annotations
 from typing import List, Dict, Any, Tuple, Optional, TYPE_CHECKING
-from copy import deepcopy
+from functools import lru_cache
 
 from dash.dependencies import Output, Input
 
@@ -19,7 +19,8 @@ from prodsim.app.callbacks.visualize_process.support import (
     create_nodes,
     create_edges,
     create_root_nodes,
-    create_dropdown_options
+    create_dropdown_options,
+    create_process_index
 )
 
 if TYPE_CHECKING:
@@ -41,59 +42,73 @@ def vis_callbacks(app, order_data_list: List[OrderData], station_data_list: List
     glob_root_nodes = create_root_nodes(order_data_list)
     dropdown_options = create_dropdown_options(order_data_list)
 
+    # Orders and stations by their name (the first one, if a name is used twice)
+    order_by_name: Dict[str, OrderData] = {order_data.name: order_data for order_data in reversed(order_data_list)}
+    station_by_name: Dict[str, StationData] = {station_data.name: station_data
+                                               for station_data in reversed(station_data_list)}
+
+    # Process steps (indices) of each station in each order
+    process_index: Dict[str, Dict[str, List[int]]] = create_process_index(order_data_list)
+
     # order_select_graph  # 0001
     @app.callback(
         [Output(component_id='cytoscape', component_property='elements'),
          Output(component_id='item_dropdown', component_property='options')],
         Input(component_id='item_dropdown', component_property='value')
     )
+    @lru_cache(maxsize=None)
     def order_select_graph(order_name: str) -> tuple:
         """Defines the behavior of the graph when the user selects an order from the drop-down menu
 
-        The path of the job is highlighted in red in the graph
+        The path of the job is highlighted in red in the graph. The process is static, so the result only depends on the
+        selected order and is cached.
 
         """
 
-        # You cannot define a node or edge twice. Therefore, the edges and nodes set must be copied and the desired
-        # edges and nodes must be deleted and replaced with red elements.
-        nodes: List[Dict[str, Any]] = deepcopy(glob_nodes)
-        edges: List[Dict[str, Any]] = deepcopy(glob_edges)
-
         if type(order_name) != str:
             # When the app is started, this callback method is called with the value -1. To catch this case the
             # basis nodes and edges are returned
-            return nodes + edges, dropdown_options
+            return glob_nodes + glob_edges, dropdown_options
 
-        # Get the station and component list of an order by the orders name
-        def get_order_attributes(search_order_name: str) -> Tuple[List[StationData], List[List[Optional[OrderData]]]]:
-
-            for order_data in order_data_list:
-                if order_data.name == search_order_name:
-                    return order_data.station, order_data.component
+        # You cannot define a node or edge twice. Therefore, each change removes one element with the old classes and
+        # adds a copy with the new classes at the end, so that the red path is drawn on top. The changes are collected
+        # first (by the data fields and the old classes of an element) and applied in one pass afterwards. The global
+        # nodes and edges are shared by all calls and are never modified.
+        edge_changes: List[Tuple[Tuple[str, str, str], str]] = []
+        node_changes: List[Tuple[Tuple[str, str, str], str]] = []
 
         # Changes the color of an edge
         def change_edge_color(edge_source: str, edge_target: str, old_classes: str, new_classes: str):
-            edges.remove({'data': {'source': edge_source,
-                                   'target': edge_target},
-                          'classes': old_classes})
-            edges.append({'data': {'source': edge_source,
-                                   'target': edge_target},
-                          'classes': new_classes})
+            edge_changes.append(((edge_source, edge_target, old_classes), new_classes))
 
         # Changes the color of a node
         def change_node_color(node_id: str, node_label: str, old_classes: str, new_classes: str):
-            element = {'data': {'id': node_id,
-                                'label': node_label},
-                       'classes': old_classes}
-            if element in nodes:
-                nodes.remove(element)
-            nodes.append({'data': {'id': node_id,
-                                   'label': node_label},
-                          'classes': new_classes})
-
-        station_data_list_: List[StationData]
-        component_data_list: List[List[Optional[OrderData]]]
-        station_data_list_, component_data_list = get_order_attributes(order_name)
+            node_changes.append(((node_id, node_label, old_classes), new_classes))
+
+        # Returns the elements without one matching element per change, followed by the copies with the new classes.
+        # Parallel elements (e.g. the edges of other orders between the same stations) are only replaced as often as
+        # they are changed
+        def recolor(elements: List[Dict[str, Any]], changes: List[Tuple[Tuple[str, str, str], str]],
+                    field_1: str, field_2: str) -> List[Dict[str, Any]]:
+
+            pending: Dict[Tuple[str, str, str], int] = {}
+            for key, _ in changes:
+                pending[key] = pending.get(key, 0) + 1
+
+            unchanged: List[Dict[str, Any]] = []
+            for element in elements:
+                key = (element['data'][field_1], element['data'][field_2], element['classes'])
+                if pending.get(key, 0):
+                    pending[key] -= 1
+                else:
+                    unchanged.append(element)
+
+            return unchanged + [{'data': {field_1: value_1, field_2: value_2}, 'classes': new_classes}
+                                for (value_1, value_2, _), new_classes in changes]
+
+        # Get the station and component list of the order
+        station_data_list_: List[StationData] = order_by_name[order_name].station
+        component_data_list: List[List[Optional[OrderData]]] = order_by_name[order_name].component
 
         if station_data_list_:
 
@@ -121,6 +136,9 @@ def vis_callbacks(app, order_data_list: List[OrderData], station_data_list: List
         # Also, the final store of the order is updated
         change_node_color(order_name, order_name + '-store', 'black triangle', 'red triangle')
 
+        nodes: List[Dict[str, Any]] = recolor(glob_nodes, node_changes, 'id', 'label')
+        edges: List[Dict[str, Any]] = recolor(glob_edges, edge_changes, 'source', 'target')
+
         return nodes + edges, dropdown_options
 
     # order_select_table #0002
@@ -128,10 +146,12 @@ def vis_callbacks(app, order_data_list: List[OrderData], station_data_list: List
         Output(component_id='item_table', component_property='data'),
         Input(component_id='item_dropdown', component_property='value')
     )
+    @lru_cache(maxsize=None)
     def order_select_table(order_name: str) -> List[Dict[str, Any]]:
         """Defines the behavior of the table (Order Data) when the user selects an order from the drop-down menu
 
-        The information shown in the table (Order Data) will be updated
+        The information shown in the table (Order Data) will be updated. The result only depends on the selected order
+        and is cached.
 
         """
 
@@ -140,13 +160,7 @@ def vis_callbacks(app, order_data_list: List[OrderData], station_data_list: List
         if type(order_name) != str:
             return []
 
-        # Returns the order object by name
-        def get_order_by_name(search_order_name: str) -> OrderData:
-            for order_data_ in order_data_list:
-                if order_data_.name == search_order_name:
-                    return order_data_
-
-        order_data: OrderData = get_order_by_name(order_name)
+        order_data: OrderData = order_by_name[order_name]
 
         # Adding the data that each job has
         table_data: List[Dict[str, Any]] = [{'attribute': 'name', 'value': order_data.name},
@@ -179,48 +193,34 @@ def vis_callbacks(app, order_data_list: List[OrderData], station_data_list: List
 
         """
 
-        # List containing the information to be displayed in the table.
-        table_data: List[Dict[str, Any]] = []
-
-        # Returns the order object by name
-        def get_order_data_by_name(search_order_name: str) -> OrderData:
-            for order_data_ in order_data_list:
-                if order_data_.name == search_order_name:
-                    return order_data_
-
-        # Returns the station object by name
-        def get_station_data_by_name(search_station_name: str) -> StationData:
-            for station_data_ in station_data_list:
-                if station_data_.name == search_station_name:
-                    return station_data_
-
-        # Returns a list of indices where the station is located in the process (order) under consideration.
-        def get_process_index(item_data_: OrderData, station_name) -> List[int]:
-            index_list_: List[int] = []
-            for index_, station_data_ in enumerate(item_data_.station):
-                if station_data_.name == station_name:
-                    index_list_.append(index_)
-            return index_list_
-
         # There are three different combinatorial possibilities from the various selection options
 
         # ---- No station is selected -----------------
 
         # If no station was selected, the table does not contain any data
         if station_info is None:
-            return table_data
+            return []
+
+        return station_table(order_name, station_info['id'], station_info['label'])
+
+    # The table only depends on the selected order and node, so it is cached
+    @lru_cache(maxsize=None)
+    def station_table(order_name: str, station_id: str, station_label: str) -> List[Dict[str, Any]]:
+
+        # List containing the information to be displayed in the table.
+        table_data: List[Dict[str, Any]] = []
 
         # ---- Selected station -----------------------
 
-        station_data: StationData = get_station_data_by_name(station_info['id'])
+        station_data: StationData = station_by_name.get(station_id)
 
-        if station_info['label'][-6:] == '-store':
+        if station_label[-6:] == '-store':
             # Selected node is a final store
 
-            order_data: OrderData = get_order_data_by_name(station_info['id'])
+            order_data: OrderData = order_by_name.get(station_id)
 
             # Add row 'name' to the table
-            table_data.append({'properties': 'name', 'value': station_info['id']})
+            table_data.append({'properties': 'name', 'value': station_id})
 
             # Add row 'storage' to the table
             if order_data.storage == float('inf'):
@@ -254,62 +254,42 @@ def vis_callbacks(app, order_data_list: List[OrderData], station_data_list: List
             # When starting the app no station is selected and order_name is -1 by default. This case is bypassed
             return table_data
 
-        order_data: OrderData = get_order_data_by_name(order_name)
-        index_list: List[int] = get_process_index(order_data, station_info['id'])
+        order_data: OrderData = order_by_name[order_name]
+        # List of indices where the station is located in the process (order) under consideration.
+        index_list: List[int] = process_index[order_name].get(station_id, [])
         function_list: List[str] = []
         # If the selected station is not part of the order, index_list is empty
-        # The string represents the name of the item and the list represents the demand of this particular item at
-        # a specific index step
-        demand_dict: Dict[str, List[int]] = {order_data.name: []} if index_list else {}
+        # The string represents the name of the item and the dict contains the demand of this particular item by the
+        # 'loop_num' of the process step. Process steps without a demand of an item are filled with 0 at the end.
+        step_demand: Dict[str, Dict[int, int]] = {order_data.name: {}} if index_list else {}
 
         for loop_num, index in enumerate(index_list):
 
+            # Components and demand of the process step 'index'
+            component_list: List[OrderData] = order_data.component[index]
+            demand = order_data.demand[index]
+
             # Add the name of the function at process step 'index' to the function_list
             function_list.append(order_data.function[index].__name__)
 
-            if order_data.component[index]:
+            if component_list:
                 # The 'index'-process step is an assembly
 
                 # In case of an assembly the demand is always 1
-                demand_dict[order_data.name].append(1)
-
-                # Get the names of all assembled items
-                assembled_components: Dict[str, int] = {order_data_.name: index_ for index_, order_data_ in
-                                                        enumerate(order_data.component[index])}
-
-                # Check if the demand_dict already keys are in the assembled items at this process step
-                # if yes: add the related demand
-                # if no: add 0
-                for key, value in demand_dict.items():
-
-                    if key == order_data.name:
-                        # The main item is already handled
-                        continue
-
-                    if key in assembled_components:
-                        demand_dict[key].append(order_data.demand[index][assembled_components[key]])
-                        assembled_components.pop(key)
-                    else:
-                        demand_dict[key].append(0)
-
-                # Since already existing items have been removed from the dict 'assembled_components' there are now
-                # only new items in the dictionary.
-                # The lists must be padded with zeros up to the current 'loop_num', since they did not occur
-                # previously
-                for component_name, component_index in assembled_components.items():
-                    demand_dict[component_name] = [0] * loop_num + \
-                                                  [order_data.demand[index][component_index]]
+                step_demand[order_data.name][loop_num] = 1
+
+                # Add the demand of each assembled item (new items are added to the dict)
+                for component, component_demand in zip(component_list, demand):
+                    step_demand.setdefault(component.name, {})[loop_num] = component_demand
             else:
                 # The 'index'-process step is a machining
 
                 # Add the demand of the main item
-                demand_dict[order_data.name].append(order_data.demand[index])
+                step_demand[order_data.name][loop_num] = demand
 
-                # Add the demand 0 for all others items
-                for key, value in demand_dict.items():
-                    if key == order_data.name:
-                        continue
-                    demand_dict[key].append(0)
+        # The list represents the demand of the item at each process step
+        demand_dict: Dict[str, List[int]] = {key: [demand.get(loop_num, 0) for loop_num in range(len(index_list))]
+                                             for key, demand in step_demand.items()}
 
         # Add the functions and the demand to the table
         if function_list:
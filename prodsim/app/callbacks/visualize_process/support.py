@@ -9,6 +9,7 @@ a callback function.
 # create_edges            #0002
 # create_root_nodes       #0003
 # create_dropdown_options #0004
+# create_process_index    #0005
 
 from __future__ import annotations
 from typing import List, Dict, Any, TYPE_CHECKING
@@ -76,35 +77,26 @@ def create_root_nodes(order_data_list: List[OrderData]) -> str:
     """
 
     # Root nodes are all nodes that have no predecessor and are not an assembly station
-    order_with_process: List[OrderData] = list(order for order in order_data_list if len(order.station) > 0)
 
-    # List of all jobs whose first station is a root node
-    first_station_name: List[str] = []
+    # Station names that are in the first position in the process and do not perform assembly (in order of appearance)
+    first_station_name: Dict[str, None] = dict.fromkeys(
+        order_data.station[0].name for order_data in order_data_list
+        if order_data.station and not isinstance(order_data.demand[0], list)
+    )
 
-    # Filtering of all stations names that are in the first position in the process and do not perform assembly
-    for order_data in order_with_process:
-        if isinstance(order_data.demand[0], list):
-            continue
-        first_station_name.append(order_data.station[0].name)
-    first_station_name = list(set(first_station_name))
-
-    # Remove all station names whose stations are not in the first place with respect to another process.
+    # Station names that are not in the first place with respect to another process. Only exception: in the process
+    # where the station is again appearance is also the process where the station is in the first place
+    later_station_name: set = set()
     for order_data in order_data_list:
         for station_data in order_data.station[1:]:
-            if station_data.name in first_station_name:
-                if station_data.name == order_data.station[0].name:
-                    # Only exception: in the process where the station is again appearance is also the process where
-                    # the station is in the first place
-                    continue
-                first_station_name.remove(station_data.name)
+            if station_data.name != order_data.station[0].name:
+                later_station_name.add(station_data.name)
+
+    root_station_name: List[str] = [station for station in first_station_name if station not in later_station_name]
 
     # According to the library dash_cytoscape the following syntax must be used regarding the root nodes
     # '#root_name_1, #root_name_2, ... #root_name_n'
-    roots: str = ''
-    for station_name in first_station_name:
-        roots += '#' + station_name + ', '
-
-    return roots.strip(', ')
+    return ', '.join('#' + station_name for station_name in root_station_name)
 
 # create_dropdown_options #0004
 def create_dropdown_options(order_data_list: List[OrderData]) -> List[Dict[str, Any]]:
@@ -113,3 +105,25 @@ def create_dropdown_options(order_data_list: List[OrderData]) -> List[Dict[str,
     # Using the syntax of dash, for each order in the process
     # {'label': .., 'value': ..}
     return [{'label': data.name, 'value': data.name} for data in order_data_list]
+
+
+# create_process_index #0005
+def create_process_index(order_data_list: List[OrderData]) -> Dict[str, Dict[str, List[int]]]:
+    """Creates for each order a dict, that maps the name of each station of the order to the list of process steps
+    (indices), at which the station is visited."""
+
+    process_index: Dict[str, Dict[str, List[int]]] = {}
+
+    for order_data in order_data_list:
+
+        if order_data.name in process_index:
+            # Only the first order of a name is used
+            continue
+
+        station_index: Dict[str, List[int]] = {}
+        for index, station_data in enumerate(order_data.station):
+            station_index.setdefault(station_data.name, []).append(index)
+
+        process_index[order_data.name] = station_index
+
+    return process_index
@@ -16,6 +16,27 @@
 import dash_bootstrap_components as dbc
 from dash import html, dcc, dash_table
 
+# Styles shared by the labels, the input fields and the rows of the dialogs (they are never modified)
+style_label: dict = {'width': '140px'}
+style_input: dict = {'width': '325px'}
+style_row: dict = {'margin-top': '7px'}
+
+# Styles of the attribute tables, which get a fixed cell width and a maximum height so that they can be virtualized
+style_attribute_table: dict = {'width': '325px', 'maxHeight': '180px', 'overflowY': 'auto'}
+style_attribute_cell: dict = {'minWidth': '60px', 'width': '80px', 'maxWidth': '120px'}
+
+
+def input_row(label: str, input_id: str, placeholder: str, first_row: bool = False) -> html.Div:
+    """Returns a row of a dialog, that consists of a label and an input field. All rows except the first one of a
+    dialog have a margin at the top.
+    """
+
+    children: list = [html.Label(label, style=style_label),
+                      dcc.Input(id=input_id, placeholder=placeholder, style=style_input)]
+
+    return html.Div(children=children) if first_row else html.Div(children=children, style=style_row)
+
+
 # Change Order #0001
 mdl_change_order = dbc.Modal(
     id="modal_change_order",
@@ -32,9 +53,7 @@ mdl_change_order = dbc.Modal(
                     children=[
                         html.Label(
                             'Name:',
-                            style={
-                                'width': '140px'
-                            }
+                            style=style_label
                         ),
                         html.Div(
                             id='order_name_input_',
@@ -65,94 +84,16 @@ mdl_change_order = dbc.Modal(
                     ]
                 ),
                 # Priority
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Priority:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='order_priority_input_',
-                            placeholder='priority',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                ),
+                input_row('Priority:', 'order_priority_input_', 'priority'),
                 # Storage
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Storage:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='order_storage_input_',
-                            placeholder='storage',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                ),
+                input_row('Storage:', 'order_storage_input_', 'storage'),
                 # Source
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Source:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='order_source_input_',
-                            placeholder='source name',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                ),
+                input_row('Source:', 'order_source_input_', 'source name'),
                 # Sink
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Sink:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='order_sink_input_',
-                            placeholder='sink name',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                ),
+                input_row('Sink:', 'order_sink_input_', 'sink name'),
                 # Horizontal line
                 html.Hr(
-                    style={
-                        'margin-top': '7px'
-                    }
+                    style=style_row
                 ),
                 # Attributes
                 html.Div(
@@ -160,9 +101,7 @@ mdl_change_order = dbc.Modal(
                     children=[
                         html.Label(
                             'Attributes:',
-                            style={
-                                'width': '140px',
-                            }
+                            style=style_label
                         ),
                         html.Div(
                             children=[
@@ -177,9 +116,12 @@ mdl_change_order = dbc.Modal(
                                     data=[],
                                     editable=False,
                                     # row_deletable=True,
-                                    style_table={
-                                        'width': '325px'
-                                    }
+                                    # Only the visible rows are rendered, the header stays on top while scrolling
+                                    virtualization=True,
+                                    page_action='none',
+                                    fixed_rows={'headers': True},
+                                    style_table=style_attribute_table,
+                                    style_cell=style_attribute_cell
                                 ),
                                 # Add component button
                                 dbc.Button(
@@ -245,65 +187,11 @@ mdl_change_station = dbc.Modal(
         dbc.ModalBody(
             children=[
                 # Station name
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Name:',
-                            style={
-                                'width': '140px',
-                            }
-                        ),
-                        dcc.Input(
-                            id='station_name_input',
-                            placeholder='station name',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ]
-                ),
+                input_row('Name:', 'station_name_input', 'station name', first_row=True),
                 # Capacity
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Capacity:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='station_capacity_input',
-                            placeholder='capacity',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                ),
+                input_row('Capacity:', 'station_capacity_input', 'capacity'),
                 # Storage
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Storage:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='station_storage_input',
-                            placeholder='storage',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                ),
+                input_row('Storage:', 'station_storage_input', 'storage'),
                 # Measurement
                 html.Div(
                     children=[
@@ -370,16 +258,12 @@ mdl_change_station = dbc.Modal(
                     children=[
                         html.Label(
                             'Function:',
-                            style={
-                                'width': '140px',
-                            }
+                            style=style_label
                         ),
                         dcc.Input(
                             id='station_function_input',
                             placeholder='function',
-                            style={
-                                'width': '325px'
-                            }
+                            style=style_input
                         )
                     ],
                     style={
@@ -412,21 +296,15 @@ mdl_change_station = dbc.Modal(
                     children=[
                         html.Label(
                             'Demand:',
-                            style={
-                                'width': '140px',
-                            }
+                            style=style_label
                         ),
                         dcc.Input(
                             id='station_demand_input',
                             placeholder='demand',
-                            style={
-                                'width': '325px'
-                            }
+                            style=style_input
                         )
                     ],
-                    style={
-                        'margin-top': '7px'
-                    }
+                    style=style_row
                 ),
                 # Component
                 html.Div(
@@ -434,9 +312,7 @@ mdl_change_station = dbc.Modal(
                     children=[
                         html.Label(
                             'Component:',
-                            style={
-                                'width': '140px',
-                            }
+                            style=style_label
                         ),
                         html.Div(
                             children=[
@@ -487,9 +363,7 @@ mdl_change_station = dbc.Modal(
                 ),
                 # Horizontal line
                 html.Hr(
-                    style={
-                        'margin-top': '7px'
-                    }
+                    style=style_row
                 ),
                 # Attributes
                 html.Div(
@@ -497,9 +371,7 @@ mdl_change_station = dbc.Modal(
                     children=[
                         html.Label(
                             'Attributes:',
-                            style={
-                                'width': '140px',
-                            }
+                            style=style_label
                         ),
                         html.Div(
                             children=[
@@ -514,9 +386,12 @@ mdl_change_station = dbc.Modal(
                                     data=[],
                                     editable=False,
                                     # row_deletable=True,
-                                    style_table={
-                                        'width': '325px'
-                                    }
+                                    # Only the visible rows are rendered, the header stays on top while scrolling
+                                    virtualization=True,
+                                    page_action='none',
+                                    fixed_rows={'headers': True},
+                                    style_table=style_attribute_table,
+                                    style_cell=style_attribute_cell
                                 ),
                                 # Add component button
                                 dbc.Button(
@@ -567,44 +442,9 @@ mdl_create_files = dbc.Modal(
         dbc.ModalBody(
             children=[
                 # Project name
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Name:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='name_input',
-                            placeholder='project name',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ]
-                ),
+                input_row('Name:', 'name_input', 'project name', first_row=True),
                 # Path
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Path:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='path_input',
-                            placeholder='path',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                )
+                input_row('Path:', 'path_input', 'path')
 
             ]
         ),
@@ -633,128 +473,17 @@ mdl_add_order = dbc.Modal(
         dbc.ModalBody(
             children=[
                 # Order Name
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Order name:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='order_name_input',
-                            placeholder='order name',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ]
-                ),
+                input_row('Order name:', 'order_name_input', 'order name', first_row=True),
                 # Source
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Source name:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='source_name_input',
-                            placeholder='source name',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                ),
+                input_row('Source name:', 'source_name_input', 'source name'),
                 # Sink
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Sink name:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='sink_name_input',
-                            placeholder='sink name',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                ),
+                input_row('Sink name:', 'sink_name_input', 'sink name'),
                 # Order Number Stations
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Number stations:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='number_stations_input',
-                            placeholder='number stations',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                ),
+                input_row('Number stations:', 'number_stations_input', 'number stations'),
                 # Storage
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Storage:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='storage_input',
-                            placeholder='storage',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                ),
+                input_row('Storage:', 'storage_input', 'storage'),
                 # Priority
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Priority:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='priority_input',
-                            placeholder='priority',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                )
+                input_row('Priority:', 'priority_input', 'priority')
 
             ]
         ),
@@ -783,44 +512,9 @@ mdl_combine_stations = dbc.Modal(
         dbc.ModalBody(
             children=[
                 # First station
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Name station 1:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='cs_station_1',
-                            placeholder='first station name',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ]
-                ),
+                input_row('Name station 1:', 'cs_station_1', 'first station name', first_row=True),
                 # Second station
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Name station 2:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='cs_station_2',
-                            placeholder='second station name',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ],
-                    style={
-                        'margin-top': '7px'
-                    }
-                ),
+                input_row('Name station 2:', 'cs_station_2', 'second station name'),
             ]
         ),
         dbc.ModalFooter(
@@ -852,23 +546,7 @@ mdl_add_attribute = dbc.Modal(
         dbc.ModalBody(
             children=[
                 # Attribute
-                html.Div(
-                    children=[
-                        html.Label(
-                            'Attribute name:',
-                            style={
-                                'width': '140px'
-                            }
-                        ),
-                        dcc.Input(
-                            id='attribute_name_input',
-                            placeholder='attribute name',
-                            style={
-                                'width': '325px'
-                            }
-                        )
-                    ]
-                ),
+                input_row('Attribute name:', 'attribute_name_input', 'attribute name', first_row=True),
                 # Distribution
                 html.Div(
                     children=[
@@ -921,9 +599,7 @@ mdl_add_attribute = dbc.Modal(
                         dcc.Input(
                             id='add_attr_param_one_input',
                             placeholder='parameter one',
-                            style={
-                                'width': '325px'
-                            }
+                            style=style_input
                         )
                     ],
                     style={
@@ -945,9 +621,7 @@ mdl_add_attribute = dbc.Modal(
                         dcc.Input(
                             id='add_attr_param_two_input',
                             placeholder='parameter two',
-                            style={
-                                'width': '325px'
-                            }
+                            style=style_input
                         )
                     ],
                     style={
@@ -987,9 +661,7 @@ mdl_edit_factory = dbc.Modal(
                     children=[
                         html.Label(
                             'Functions:',
-                            style={
-                                'width': '140px',
-                            }
+                            style=style_label
                         ),
                         html.Div(
                             children=[
@@ -1044,15 +716,11 @@ mdl_edit_factory = dbc.Modal(
                         ),
                         # Horizontal line
                         html.Hr(
-                            style={
-                                'margin-top': '7px'
-                            }
+                            style=style_row
                         ),
                         html.Label(
                             'Attributes:',
-                            style={
-                                'width': '140px',
-                            }
+                            style=style_label
                         ),
                         html.Div(
                             children=[
@@ -1067,9 +735,12 @@ mdl_edit_factory = dbc.Modal(
                                     data=[],
                                     editable=False,
                                     # row_deletable=True,
-                                    style_table={
-                                        'width': '325px'
-                                    }
+                                    # Only the visible rows are rendered, the header stays on top while scrolling
+                                    virtualization=True,
+                                    page_action='none',
+                                    fixed_rows={'headers': True},
+                                    style_table=style_attribute_table,
+                                    style_cell=style_attribute_cell
                                 ),
                                 # Add component button
                                 dbc.Button(
@@ -6,7 +6,7 @@ from prodsim.filehandler import FileHandler
 from prodsim.visualizer import Visualizer
 from prodsim.simulator import Simulator
 from prodsim.inspector import Inspector
-from prodsim.exception import MissingData
+from prodsim.exception import MissingData, InvalidType, InvalidValue
 from prodsim.components import Component
 from prodsim.helper import Helper
 from prodsim.tracker import Tracker
@@ -108,7 +108,8 @@ class Environment:
         self.__simulator.simulate(self.__filehandler, sim_time, self.__env, track_components, progress_bar, max_memory,
                                   bit_type)
 
-    def data_to_csv(self, path_to_wd: str, remove_column: List[str] = None, keep_original: bool = True) -> None:
+    def data_to_csv(self, path_to_wd: str, remove_column: List[str] = None, keep_original: bool = True,
+                    chunksize: int = 1000) -> None:
         """Exports the simulation data to csv files.
 
         :param path_to_wd: Path to the target directory
@@ -117,7 +118,11 @@ class Environment:
         :type remove_column: List[str], optional
         :param keep_original: Keep an additional original file without removed columns
         :type keep_original: bool, optional
+        :param chunksize: Number of rows that are formatted and written to a file at once
+        :type chunksize: int, optional
         :raises MissingData: ``simulate`` was not called before
+        :raises InvalidType: ``chunksize`` is not of type int
+        :raises InvalidValue: ``chunksize`` is not greater than zero
 
         .. note::
 
@@ -125,10 +130,16 @@ class Environment:
 
         """
 
+        if not isinstance(chunksize, int):
+            raise InvalidType("The chunksize is of type {type}, but must be 'int' instead."
+                              .format(type=type(chunksize).__name__))
+        if not chunksize > 0:
+            raise InvalidValue("The chunksize is {val}, but must be greater than zero.".format(val=chunksize))
+
         if remove_column is None:
             remove_column = []
 
-        self.__filehandler.data_to_csv(path_to_wd, remove_column, keep_original)
+        self.__filehandler.data_to_csv(path_to_wd, remove_column, keep_original, chunksize)
     
     def data_to_hdf5(self, path_to_wd: str, file_name: str) -> None:
         """Exports the simulation data to hdf5 files.
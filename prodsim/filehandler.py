@@ -8,7 +8,7 @@ from inspect import getmembers, isfunction
 from typing import List, Tuple, Dict, Any, Union, Optional, Callable, Iterator
 
 from h5py import File
-from numpy import savetxt
+from numpy import ndarray
 from simpy import Environment
 
 from prodsim.helper import Helper
@@ -308,10 +308,11 @@ class FileHandler:
         Helper.add_user_distribution(distribution_list)
 
     @staticmethod
-    def data_to_csv(path_to_wd: str, remove_column: List[str], keep_original: bool) -> None:
+    def data_to_csv(path_to_wd: str, remove_column: List[str], keep_original: bool, chunksize: int) -> None:
         """Serves as an entry point for Blackboard to export the data in csv format.
 
-        The internal file for caching is read in and each group is exported in the form of a csv file.
+        The internal file for caching is read in and each group is exported in the form of a csv file. The rows are
+        formatted and written in chunks of 'chunksize' rows.
 
         """
 
@@ -354,20 +355,44 @@ class FileHandler:
                     with open(path_to_wd + str(group_name) + '_orig.csv', 'a') as f:
                         f.write(header_orig.strip(',') + '\n')
                         for obj_ in g:
-                            savetxt(f, g.get(obj_), delimiter=',', fmt=fmt)
+                            FileHandler.__write_rows(f, g.get(obj_), None, fmt, chunksize)
 
                 # Create a new csv file with the suffix '_orig.csv' and write the header row, as well as the data of
                 # non-removed columns into this file
                 with open(path_to_wd + str(group_name) + '.csv', 'a') as f:
                     f.write(header.strip(',') + '\n')
                     for obj_ in g:
-                        savetxt(f, g.get(obj_)[:, column_indices], delimiter=',', fmt=fmt)
+                        FileHandler.__write_rows(f, g.get(obj_), column_indices, fmt, chunksize)
 
         # Removing the temporary folder structure to prepare the program for the next simulation run.
         # note: If data_to_csv is not called, then the data from the simulation will remain in the _temp folder until a
         # simulation is started again, or data_to_csv is called in a different context.
         rmtree(path.join(path.dirname(__file__) + '/_temp_data/_temp'))
 
+    @staticmethod
+    def __write_rows(f: Any, dataset: Any, column_indices: Optional[List[int]], fmt: str, chunksize: int) -> None:
+        """Writes the rows of a dataset to an open csv file
+
+        Instead of writing each row separately, 'chunksize' rows are read from the dataset, formatted and written with a
+        single call.
+
+        """
+
+        num_columns: int = dataset.shape[1] if column_indices is None else len(column_indices)
+
+        # Format string for a whole row, e.g. '%.8g,%.8g,%.8g\n'
+        row_fmt: str = ','.join([fmt] * num_columns) + '\n'
+
+        for start in range(0, dataset.shape[0], chunksize):
+
+            chunk: ndarray
+            if column_indices is None:
+                chunk = dataset[start:start + chunksize]
+            else:
+                chunk = dataset[start:start + chunksize, column_indices]
+
+            f.write(''.join([row_fmt % tuple(row) for row in chunk.tolist()]))
+
     @staticmethod
     def data_to_hdf5(path_to_wd: str, file_name: str) -> None:
         """Serves as an entry point for Blackboard to export the data in hdf5 format.
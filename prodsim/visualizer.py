@@ -5,10 +5,7 @@ from os import path
 from dash import Dash, html
 import dash_bootstrap_components as dbc
 
-# Import the layout elements
-import prodsim.app.layout.define_process.base as base
-import prodsim.app.layout.define_process.modal as modal
-import prodsim.app.layout.define_process.popup as popup
+# Import the layout elements (the layout of the app 'define process' is imported in __dp_app)
 import prodsim.app.layout.visualize_process.graph as graph
 import prodsim.app.layout.visualize_process.table as table
 
@@ -82,6 +79,11 @@ class Visualizer:
         callbacks -> prodsim.app.callbacks.visualize_process
         """
 
+        # The dialogs of this app are only built, when the app is started and not on every import of prodsim
+        import prodsim.app.layout.define_process.base as base
+        import prodsim.app.layout.define_process.modal as modal
+        import prodsim.app.layout.define_process.popup as popup
+
         # layout
         app.layout = html.Div(
             children=[